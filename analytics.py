@@ -0,0 +1,177 @@
+# analytics.py
+"""
+Attempt-history statistics, computed with NumPy over whole columns.
+
+`AttemptHistory` keeps one user's attempts on one stack as arrays and only
+fetches rows it has not seen yet; summaries are memoised until it grows.
+"""
+import threading
+from operator import itemgetter
+
+import numpy as np
+
+from engine import DIRECTIONS
+from stacks import Stack
+
+DAY = 86400
+
+# Columns fetched by AttemptStore.history(), in order.
+HISTORY_FIELDS = ("id", "direction", "position", "correct", "latency_ms", "answered_at")
+
+
+def _group_percentiles(groups: np.ndarray, values: np.ndarray, size: int,
+                       percentiles) -> np.ndarray:
+    """
+    Percentiles of `values` per group id in [0, size), linearly interpolated
+    like np.percentile. Values are whole non-negative numbers (ms) or NaN,
+    which is ignored; empty groups give NaN. Returns an array of shape
+    (len(percentiles), size).
+
+    Group and value are packed into one int64 key, so a single sort orders
+    both (several times faster than np.lexsort on two columns).
+    """
+    keep = ~np.isnan(values)
+    keys = (groups[keep].astype(np.int64) << 32) | values[keep].astype(np.int64)
+    keys.sort()
+    counts = np.bincount(keys >> 32, minlength=size)
+    values = (keys & 0xFFFFFFFF).astype(np.float64)
+    starts = np.cumsum(counts) - counts
+    has = counts > 0
+    out = np.full((len(percentiles), size), np.nan)
+    for row, pct in enumerate(percentiles):
+        rank = (counts[has] - 1) * (pct / 100)
+        low = np.floor(rank).astype(np.int64)
+        high = np.ceil(rank).astype(np.int64)
+        lo_val = values[starts[has] + low]
+        hi_val = values[starts[has] + high]
+        out[row, has] = lo_val + (hi_val - lo_val) * (rank - low)
+    return out
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    out = np.full(num.shape, np.nan)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
+
+
+class Summary:
+    """
+    Per-position statistics (index 0 = position 1) and daily trend.
+
+    `by_card` is `accuracy` re-indexed by card code (cards.ALL_CARDS order).
+    Latency arrays are in ms and NaN where nothing was timed.
+    """
+
+    __slots__ = (
+        "graded", "correct", "accuracy", "latency_p50", "latency_p90", "by_card",
+        "total_graded", "total_correct", "latency_overall",
+        "days", "day_graded", "day_accuracy",
+    )
+
+    def __init__(self, history: "AttemptHistory", stack: Stack, direction: str | None):
+        size = len(stack)
+        mask = history.correct >= 0
+        if direction is not None:
+            mask &= history.direction == DIRECTIONS.index(direction)
+        index = history.position[mask].astype(np.int64) - 1
+        correct = history.correct[mask]
+        latency = history.latency[mask]
+
+        self.graded = np.bincount(index, minlength=size)
+        self.correct = np.bincount(index, weights=correct, minlength=size).astype(np.int64)
+        self.accuracy = _ratio(self.correct, self.graded)
+        self.latency_p50, self.latency_p90 = _group_percentiles(index, latency, size, (50, 90))
+        self.by_card = np.empty(size)
+        self.by_card[np.frombuffer(stack.order, dtype=np.uint8)] = self.accuracy
+
+        self.total_graded = int(mask.sum())
+        self.total_correct = int(correct.sum())
+        self.latency_overall = _group_percentiles(
+            np.zeros(len(latency), dtype=np.int64), latency, 1, (50, 90)
+        )[:, 0]
+
+        # Day numbers are offset from the first day and counted with bincount;
+        # days without attempts are dropped afterwards.
+        day_numbers = (history.answered_at[mask] * (1 / DAY)).astype(np.int64)
+        first = int(day_numbers.min()) if day_numbers.size else 0
+        per_day = np.bincount(day_numbers - first)
+        correct_per_day = np.bincount(day_numbers - first, weights=correct)
+        active = np.flatnonzero(per_day)
+        self.days = active + first
+        self.day_graded = per_day[active]
+        self.day_accuracy = correct_per_day[active] / self.day_graded
+
+    def overall_accuracy(self) -> float | None:
+        return self.total_correct / self.total_graded if self.total_graded else None
+
+
+class AttemptHistory:
+    """
+    Columnar copy of a user's attempts on one stack.
+
+    `refresh()` appends only rows with an id above the last one seen, so
+    keeping it current costs one indexed query per call. Summaries are cached
+    per direction and dropped whenever rows are appended. Both hold the lock:
+    the instance is shared between sessions, and a summary must not read
+    columns that a refresh has only partly extended.
+    """
+
+    __slots__ = ("user", "stack_name", "last_id", "direction", "position", "correct",
+                 "latency", "answered_at", "_summaries", "_lock")
+
+    def __init__(self, user: str, stack_name: str):
+        self.user = user
+        self.stack_name = stack_name
+        self.last_id = 0
+        self.direction = np.empty(0, dtype=np.int8)
+        self.position = np.empty(0, dtype=np.int16)
+        self.correct = np.empty(0, dtype=np.int8)    # 1 / 0, -1 for reveal-only
+        self.latency = np.empty(0, dtype=np.float64)  # ms, NaN if not measured
+        self.answered_at = np.empty(0, dtype=np.float64)
+        self._summaries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def extend(self, rows: list[tuple]) -> int:
+        """Append rows in HISTORY_FIELDS order (ascending id)."""
+        if not rows:
+            return 0
+        # Column-wise conversion; unpacking with zip(*rows) is several
+        # times slower on large first loads.
+        n = len(rows)
+        codes = {d: i for i, d in enumerate(DIRECTIONS)}
+        self.direction = np.concatenate((
+            self.direction,
+            np.fromiter(map(codes.__getitem__, map(itemgetter(1), rows)), np.int8, n),
+        ))
+        self.position = np.concatenate(
+            (self.position, np.fromiter(map(itemgetter(2), rows), np.int16, n))
+        )
+        self.correct = np.concatenate((
+            self.correct,
+            np.array([-1 if c is None else c for c in map(itemgetter(3), rows)], np.int8),
+        ))
+        self.latency = np.concatenate(
+            (self.latency, np.array(list(map(itemgetter(4), rows)), np.float64))
+        )
+        self.answered_at = np.concatenate(
+            (self.answered_at, np.fromiter(map(itemgetter(5), rows), np.float64, n))
+        )
+        self.last_id = rows[-1][0]
+        self._summaries = {}
+        return len(rows)
+
+    def refresh(self, store) -> int:
+        """Fetch attempts newer than the last seen id from `store`."""
+        with self._lock:
+            return self.extend(store.history(self.user, self.stack_name, self.last_id))
+
+    def summary(self, stack: Stack, direction: str | None = None) -> Summary:
+        """Statistics for one direction (None: both), cached until new rows arrive."""
+        with self._lock:
+            summaries = self._summaries
+            if direction not in summaries:
+                summaries[direction] = Summary(self, stack, direction)
+            return summaries[direction]
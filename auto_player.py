@@ -0,0 +1,37 @@
+# auto_player.py
+import os
+import uuid
+
+import streamlit.components.v1 as components
+
+from card_art import STYLESHEET_URL
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "auto_player")
+_component = components.declare_component("auto_player", path=_FRONTEND)
+
+
+def new_batch_id() -> str:
+    return uuid.uuid4().hex
+
+
+def auto_player(questions: list[dict], batch_id: str, think_seconds: int,
+                reveal_seconds: int = 3, key: str | None = None):
+    """
+    Play a pre-generated batch of auto-drill questions in the browser.
+
+    Each question is a dict with `title`, `question` and `answer` (HTML,
+    cards as in helpers.render_card).
+    Thinking time, reveal and advance all happen client-side; the component
+    returns `{"id", "shown", "offsets", "ms"}` once, when the batch ends or
+    is stopped, and None until then. `offsets[i]` is when question i was
+    shown, in ms after the batch started; `ms` is the whole batch.
+    """
+    return _component(
+        questions=questions,
+        batch_id=batch_id,
+        think_seconds=think_seconds,
+        reveal_seconds=reveal_seconds,
+        stylesheet=STYLESHEET_URL,
+        key=key,
+        default=None,
+    )
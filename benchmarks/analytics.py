@@ -0,0 +1,97 @@
+# benchmarks/analytics.py
+"""
+Analytics over a large synthetic attempt history.
+
+Fills a temporary AttemptStore with N attempts, then times: the first
+load into AttemptHistory, a refresh with no new rows, a refresh after a
+few new attempts, computing a Summary, and a cached Summary. The NumPy
+results are checked against a plain Python loop over the same rows.
+
+    python -m benchmarks.analytics --attempts 300000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from analytics import AttemptHistory
+from engine import DIRECTIONS
+from stacks import get_stack
+from store import AttemptStore
+
+
+def _fill(store: AttemptStore, user: str, count: int, rng: random.Random, start: float):
+    stack = get_stack()
+    for i in range(count):
+        position = rng.randint(1, 52)
+        timed = rng.random() < 0.7
+        store.record(
+            user, stack.name, "manual", rng.choice(DIRECTIONS), position,
+            stack.card_at(position), "x", rng.random() < 0.8, start + i * 30,
+            start + i * 30 + 2, latency_ms=rng.randint(400, 9000) if timed else None,
+        )
+    store.flush()
+
+
+def _python_summary(rows: list[tuple]) -> tuple[list, list]:
+    graded = [0] * 52
+    correct = [0] * 52
+    latencies = [[] for _ in range(52)]
+    for _id, _direction, position, ok, latency, _at in rows:
+        if ok is None:
+            continue
+        graded[position - 1] += 1
+        correct[position - 1] += ok
+        if latency is not None:
+            latencies[position - 1].append(latency)
+    medians = [statistics.median(v) if v else float("nan") for v in latencies]
+    return [c / g if g else float("nan") for c, g in zip(correct, graded)], medians
+
+
+def _ms(func) -> float:
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--attempts", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    stack = get_stack()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AttemptStore(os.path.join(tmp, "bench.db"), batch_size=5000)
+        _fill(store, "bench", args.attempts, rng, time.time() - args.attempts * 30)
+        history = AttemptHistory("bench", stack.name)
+
+        timings = {
+            "first load": _ms(lambda: history.refresh(store)),
+            "refresh, nothing new": _ms(lambda: history.refresh(store)),
+        }
+        _fill(store, "bench", 10, rng, time.time())
+        timings["refresh, 10 new"] = _ms(lambda: history.refresh(store))
+        timings["summary"] = _ms(lambda: history.summary(stack))
+        timings["summary, cached"] = _ms(lambda: history.summary(stack))
+
+        rows = store.history("bench", stack.name)
+        timings["python loop (reference)"] = _ms(lambda: _python_summary(rows))
+        accuracy, medians = _python_summary(rows)
+        summary = history.summary(stack)
+        assert np.allclose(summary.accuracy, accuracy, equal_nan=True)
+        assert np.allclose(summary.latency_p50, medians, equal_nan=True)
+        store.close()
+
+    print(f"{len(history)} attempts")
+    for label, ms in timings.items():
+        print(f"{label:<26} {ms:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# benchmarks/auto_sessions.py
+"""
+How many concurrent auto-drill sessions can one Streamlit process sustain?
+
+Runs the same measurement against each app, on a fresh server per session count:
+
+    sleep     benchmarks/blocking_auto.py, the old countdown: the script
+              thread sleeps through the thinking time and the reveal pause,
+              then reruns itself
+    fragment  card_drills.py, where a fragment reruns once a second and
+              timers.AutoCycle decides what it shows
+
+Each simulated browser (see benchmarks.load) starts an auto drill and
+follows it for --seconds from then on. A tick is one countdown update; its
+latency is how much later than due it reaches the browser: for the sleep
+app, the gap between two updates minus the second the script slept; for
+the fragment, the round trip of its rerun. An overloaded server also
+drops or merges updates, so the tick rate per session is reported too; it
+is about one a second when all is well. The server's peak thread count
+and RSS are sampled from /proc. Every count in the sweep is reported; the
+largest with a tick rate of at least MIN_RATE and a p95 tick latency under
+--late-ms counts as sustained.
+
+    python -m benchmarks.auto_sessions
+    python -m benchmarks.auto_sessions --sessions 25,50,100,200 --seconds 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import websockets
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from benchmarks.load import (
+    APP, Session, free_port, monitor, proc_stats, scenario_auto, start_server,
+)
+
+BLOCKING_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blocking_auto.py")
+MIN_RATE = 0.5  # ticks per second per session
+
+
+def tick_percentiles(ticks: list[float]) -> tuple[float, float, float]:
+    """(p50, p95, max) in seconds; no ticks at all counts as infinitely late."""
+    if len(ticks) < 2:
+        return (ticks[0],) * 3 if ticks else (float("inf"),) * 3
+    cuts = statistics.quantiles(ticks, n=20, method="inclusive")
+    return cuts[9], cuts[18], max(ticks)
+
+
+async def follow_sleep(url: str, seconds: float, errors: list) -> list[float]:
+    """Start the blocking drill and time the countdown updates it pushes."""
+    ticks = []
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = Session(ws, {}, errors)
+        await session.rerun("first load")
+        await session.send(trigger="mn_auto_num_start_btn")
+        stop_at = time.monotonic() + seconds
+        last = None
+        while (timeout := stop_at - time.monotonic()) > 0:
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout)
+            except asyncio.TimeoutError:
+                break
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            if fwd.WhichOneof("type") != "delta":
+                continue
+            element = fwd.delta.new_element
+            if element.WhichOneof("type") == "exception":
+                errors.append(element.exception.message)
+            elif element.WhichOneof("type") == "markdown" and element.markdown.body.startswith("⏳"):
+                now = time.perf_counter()
+                if last is not None:
+                    ticks.append(max(0.0, now - last - 1))
+                last = now
+    return ticks
+
+
+async def follow_fragment(url: str, seconds: float, errors: list) -> list[float]:
+    """Start the live auto drill and time each of its fragment reruns."""
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        latencies = {}
+        session = Session(ws, latencies, errors)
+        await session.rerun("first load")
+        await scenario_auto(session, 0, seconds)
+    return latencies.get("auto tick", [])
+
+
+VARIANTS = {
+    "sleep": (BLOCKING_APP, follow_sleep),
+    "fragment": (APP, follow_fragment),
+}
+
+
+async def _measure(port: int, pid: int, sessions: int, seconds: float, follow) -> dict:
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    errors, samples = [], []
+    idle = proc_stats(pid)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(monitor(pid, samples, stop))
+    per_session = await asyncio.gather(*(follow(url, seconds, errors) for _ in range(sessions)))
+    ticks = [tick for session_ticks in per_session for tick in session_ticks]
+    stop.set()
+    await sampler
+    return {
+        "ticks": ticks,
+        "rate": len(ticks) / (sessions * seconds),
+        "errors": errors,
+        "threads": max(s["threads"] for s in samples),
+        "rss": max(s["rss"] for s in samples),
+        "idle_rss": idle["rss"],
+    }
+
+
+def measure(variant: str, sessions: int, seconds: float) -> dict:
+    app, follow = VARIANTS[variant]
+    with tempfile.TemporaryDirectory() as tmp:
+        port = free_port()
+        server = start_server(port, os.path.join(tmp, "auto.db"), app)
+        try:
+            return asyncio.run(_measure(port, server.pid, sessions, seconds, follow))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", default="1,5,10,20,40,80",
+                        help="comma-separated session counts to sweep")
+    parser.add_argument("--seconds", type=float, default=20,
+                        help="how long each session follows its drill (one cycle is 8 s)")
+    parser.add_argument("--late-ms", type=float, default=500,
+                        help="p95 tick latency a sustained session count stays under")
+    parser.add_argument("--variants", default=",".join(VARIANTS))
+    args = parser.parse_args(argv)
+
+    sustained = {}
+    mb = 1024 * 1024
+    print(f"{'variant':<9} {'sessions':>8} {'threads':>7} {'rss MB':>7} {'MB/sess':>8} "
+          f"{'ticks':>6} {'tick/s':>6} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7} {'errors':>6}")
+    for variant in args.variants.split(","):
+        sustained[variant] = 0
+        for sessions in (int(n) for n in args.sessions.split(",")):
+            result = measure(variant, sessions, args.seconds)
+            ticks = result["ticks"]
+            p50, p95, worst = tick_percentiles(ticks)
+            ok = (p95 * 1000 < args.late_ms and result["rate"] >= MIN_RATE
+                  and not result["errors"])
+            print(
+                f"{variant:<9} {sessions:>8} {result['threads']:>7} {result['rss'] / mb:>7.0f} "
+                f"{(result['rss'] - result['idle_rss']) / mb / sessions:>8.2f} {len(ticks):>6} {result['rate']:>6.2f} "
+                f"{p50 * 1000:>7.0f} {p95 * 1000:>7.0f} {worst * 1000:>7.0f} "
+                f"{len(result['errors']):>6}{'' if ok else '  FAIL'}"
+            )
+            for message in sorted(set(result["errors"]))[:3]:
+                print(f"{'':>18} ERROR {message}")
+            if ok:
+                sustained[variant] = max(sustained[variant], sessions)
+    print()
+    print(f"Sustained concurrent auto sessions (p95 tick latency < {args.late_ms:g} ms, "
+          f"≥ {MIN_RATE:g} ticks/s): "
+          + "  ".join(f"{variant}={n}" for variant, n in sustained.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/blocking_auto.py
+"""
+The auto drill as it was before timers.AutoCycle: the script thread sleeps
+through every second of the countdown and then reruns itself. Kept only as
+the "before" app for benchmarks.auto_sessions; run it with `streamlit run`
+from the repository root.
+"""
+import random
+import time
+
+import streamlit as st
+
+from card_art import format_card
+from stacks import MNEMONICA
+
+THINK_SECONDS = 5
+REVEAL_SECONDS = 3
+
+
+def countdown(seconds: int, label: str):
+    placeholder = st.empty()
+    for i in range(seconds, 0, -1):
+        placeholder.markdown(f"⏳ **{label}: {i}**")
+        time.sleep(1)
+    placeholder.empty()
+
+
+ss = st.session_state
+ss.setdefault("mn_auto_num_running", False)
+ss.setdefault("mn_auto_num_rounds", 0)
+
+if st.button("▶ Start session", key="mn_auto_num_start_btn"):
+    ss.mn_auto_num_running = True
+    st.rerun()
+if st.button("⏹ Stop session", key="mn_auto_num_stop_btn"):
+    ss.mn_auto_num_running = False
+    st.rerun()
+
+if ss.mn_auto_num_running:
+    pos = random.randint(1, 52)
+    ss.mn_auto_num_rounds += 1
+    st.markdown(f"### Position: `{pos}`")
+    st.caption(f"Auto questions this session: `{ss.mn_auto_num_rounds}`")
+    countdown(THINK_SECONDS, label="Think for")
+    st.success("✅ Time! The card at this position is:")
+    st.markdown(format_card(MNEMONICA[pos - 1]), unsafe_allow_html=True)
+    countdown(REVEAL_SECONDS, label="Next position in")
+    st.rerun()
@@ -0,0 +1,90 @@
+# benchmarks/imports.py
+"""
+Import-time budget for the Streamlit-free core and the tools built on it.
+
+Each module is imported in a fresh interpreter under `python -X importtime`;
+its cumulative import time (median of a few runs) must stay within its
+budget, and nothing it imports may come from a UI or heavy package. That
+keeps `python -m drill`, the exporter and scripts quick to start.
+
+    python -m benchmarks.imports            # print the table
+    python -m benchmarks.imports --check    # exit 1 when over budget
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module → budget in ms (cumulative, including everything it imports).
+BUDGETS = {
+    "cards": 25,
+    "stacks": 30,
+    "sampler": 10,
+    "scheduler": 15,
+    "engine": 35,
+    "timers": 10,
+    "store": 30,
+    "card_art": 40,
+    "drill": 60,
+    "exporter": 60,
+}
+# Top-level packages the core must not pull in.
+FORBIDDEN = ("streamlit", "numpy", "pandas", "pyarrow", "altair", "tornado", "starlette")
+
+
+def import_profile(module: str) -> tuple[float, set[str]]:
+    """(cumulative ms of `import module`, every module it imported)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | <indent>name";
+    # everything before our module's subtree belongs to interpreter start-up.
+    lines = [line.split("|") for line in result.stderr.splitlines()
+             if line.startswith("import time:") and "[us]" not in line]
+    ours = next(i for i, (_, _, name) in enumerate(lines) if name == " " + module)
+    start = ours
+    while start > 0 and lines[start - 1][2].startswith("  "):
+        start -= 1
+    imported = {name.strip() for _, _, name in lines[start:ours + 1]}
+    return int(lines[ours][1]) / 1000, imported
+
+
+def measure(module: str, repeat: int) -> tuple[float, list[str]]:
+    times = []
+    bad = set()
+    for _ in range(repeat):
+        ms, imported = import_profile(module)
+        times.append(ms)
+        bad |= {name for name in imported if name.split(".")[0] in FORBIDDEN}
+    return statistics.median(times), sorted(bad)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="fail when over budget")
+    args = parser.parse_args(argv)
+
+    problems = []
+    print(f"{'module':<10} {'ms':>7} {'budget':>7}")
+    for module, budget in BUDGETS.items():
+        ms, bad = measure(module, args.repeat)
+        print(f"{module:<10} {ms:>7.1f} {budget:>7}")
+        if ms > budget:
+            problems.append(f"{module}: {ms:.1f} ms > {budget} ms")
+        if bad:
+            problems.append(f"{module} imports {', '.join(bad[:5])}")
+
+    if args.check:
+        for problem in problems:
+            print(f"OVER BUDGET {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
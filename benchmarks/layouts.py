@@ -0,0 +1,70 @@
+# benchmarks/layouts.py
+"""
+Cold-start and per-rerun timings for the eager and lazy page layouts.
+
+"eager" imports every page module before the first run, which is what the
+single-module app did; "lazy" is the routing shell in card_drills.py, which
+imports a page module the first time that page is shown. Each layout runs
+in a fresh interpreter so module caches do not leak between them.
+
+    python -m benchmarks.layouts --reruns 10
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from benchmarks.payload import APP
+
+_CHILD = r"""
+import importlib, json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+
+app, layout, reruns = sys.argv[1], sys.argv[2], int(sys.argv[3])
+pages = ["info", "mn_manual", "mn_auto", "mn_flash"]
+
+started = time.perf_counter()
+if layout == "eager":
+    for name in ("info", "mnemonica.manual", "mnemonica.auto", "mnemonica.flashcards"):
+        importlib.import_module(name)
+at = AppTest.from_file(app, default_timeout=30).run()
+result = {"cold_ms": (time.perf_counter() - started) * 1000, "pages": {}}
+
+for page in pages:
+    at.session_state["page"] = page
+    t = time.perf_counter()
+    at.run()
+    first = (time.perf_counter() - t) * 1000
+    times = []
+    for _ in range(reruns):
+        t = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t) * 1000)
+    result["pages"][page] = {"first_ms": first, "rerun_ms": statistics.median(times)}
+
+print(json.dumps(result))
+"""
+
+
+def measure(layout: str, reruns: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, APP, layout, str(reruns)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    results = {layout: measure(layout, args.reruns) for layout in ("eager", "lazy")}
+    for layout, r in results.items():
+        print(f"{layout}: cold start {r['cold_ms']:.1f} ms")
+        for page, m in r["pages"].items():
+            print(f"  {page:<10} first visit {m['first_ms']:7.1f} ms   rerun {m['rerun_ms']:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
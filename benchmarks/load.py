@@ -0,0 +1,336 @@
+# benchmarks/load.py
+"""
+Concurrent-session load test against a real `streamlit run card_drills.py`.
+
+Starts the app in a subprocess on a free local port and connects N
+simulated browsers to it over Streamlit's own websocket protocol, so every
+rerun goes through the real server, session manager and script threads.
+Each session loops over a weighted mix of scenarios:
+
+    info    open the information page
+    manual  new question, type an answer, check it
+    auto    start a live auto session, follow its once-a-second fragment
+            reruns for --auto-seconds, stop it
+    flash   draw new flashcards
+
+with --think seconds (±50%) between actions. Reports rerun latency
+percentiles overall and per action, plus the server process's peak thread
+count, CPU use and peak RSS. Everything runs on this machine; attempts go to
+a throwaway database. Needs the `websockets` package (installed alongside
+recent Streamlit) and reads process stats from /proc (Linux). The simulated
+browsers share the machine with the server, so on few cores they compete
+with it for CPU; treat the numbers as a lower bound on capacity.
+
+    python -m benchmarks.load --sessions 20 --seconds 30
+    python -m benchmarks.load --sessions 10,20,40 --mix manual=3,auto=1,flash=2
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.payload import APP
+from cards import ALL_CARDS
+
+PAGE_BUTTONS = {
+    "info": "Information",
+    "manual": "Manual drills",
+    "auto": "Auto drills",
+    "flash": "Flashcards",
+}
+DEFAULT_MIX = "info=1,manual=4,auto=2,flash=3"
+_EARLY = ForwardMsg.ScriptFinishedStatus.Value("FINISHED_EARLY_FOR_RERUN")
+
+
+# ===================== SIMULATED BROWSER =====================
+class Session:
+    """
+    One browser tab: sends rerun requests with the current widget states and
+    reads forward messages until the run finishes. Widget ids are learned from
+    the elements the server sends (by user key, else by label).
+    """
+
+    def __init__(self, ws, latencies: dict, errors: list):
+        self.ws = ws
+        self.latencies = latencies
+        self.errors = errors
+        self.widgets = {}
+        self.values = {}
+        self.fragments = {}
+
+    async def rerun(self, action: str, trigger: str | None = None,
+                    fragment_id: str | None = None):
+        started = time.perf_counter()
+        await self.send(trigger, fragment_id)
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                self._element(fwd.delta.new_element)
+            elif kind == "auto_rerun":
+                self.fragments[fwd.auto_rerun.fragment_id] = fwd.auto_rerun.interval
+            elif kind == "script_finished" and fwd.script_finished != _EARLY:
+                break
+        self.latencies.setdefault(action, []).append(time.perf_counter() - started)
+
+    async def send(self, trigger: str | None = None, fragment_id: str | None = None):
+        """Request a rerun without waiting for it."""
+        msg = BackMsg()
+        client = msg.rerun_script
+        client.query_string = ""
+        client.page_script_hash = ""
+        client.widget_states.widgets.extend(self.values.values())
+        if trigger is not None:
+            state = client.widget_states.widgets.add()
+            state.id = self.widgets[trigger]
+            state.trigger_value = True
+        if fragment_id is not None:
+            client.fragment_id = fragment_id
+            client.is_auto_rerun = True
+        await self.ws.send(msg.SerializeToString())
+
+    def _element(self, element):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.errors.append(element.exception.message)
+            return
+        widget = getattr(element, kind, None) if kind else None
+        widget_id = getattr(widget, "id", "")
+        if widget_id.startswith("$$ID-"):
+            key = widget_id.rsplit("-", 1)[-1]
+            self.widgets[getattr(widget, "label", key) if key == "None" else key] = widget_id
+
+    def set_text(self, key: str, value: str):
+        state = WidgetState(id=self.widgets[key], string_value=value)
+        self.values[key] = state
+
+    async def click(self, action: str, key: str):
+        await self.rerun(action, trigger=key)
+
+
+# ===================== SCENARIOS =====================
+async def _pause(think: float):
+    await asyncio.sleep(think * random.uniform(0.5, 1.5))
+
+
+async def scenario_info(s: Session, think: float, auto_seconds: float):
+    await s.click("open page", PAGE_BUTTONS["info"])
+    await _pause(think)
+
+
+async def scenario_manual(s: Session, think: float, auto_seconds: float):
+    await s.click("open page", PAGE_BUTTONS["manual"])
+    for _ in range(3):
+        await _pause(think)
+        await s.click("new question", "mn_manual_num_new")
+        await _pause(think)
+        s.set_text("mn_manual_num_answer_input", random.choice(ALL_CARDS))
+        await s.click("check answer", "mn_manual_num_check")
+
+
+async def scenario_auto(s: Session, think: float, auto_seconds: float):
+    await s.click("open page", PAGE_BUTTONS["auto"])
+    await _pause(think)
+    s.fragments.clear()
+    await s.click("start auto", "mn_auto_num_start_btn")
+    stop_at = time.monotonic() + auto_seconds
+    while s.fragments and time.monotonic() < stop_at:
+        fragment_id, interval = next(iter(s.fragments.items()))
+        await asyncio.sleep(interval)
+        await s.rerun("auto tick", fragment_id=fragment_id)
+    await s.click("stop auto", "mn_auto_num_stop_btn")
+
+
+async def scenario_flash(s: Session, think: float, auto_seconds: float):
+    await s.click("open page", PAGE_BUTTONS["flash"])
+    for _ in range(3):
+        await _pause(think)
+        await s.click("new card", "mn_flash_new_bottom")
+
+
+SCENARIOS = {
+    "info": scenario_info,
+    "manual": scenario_manual,
+    "auto": scenario_auto,
+    "flash": scenario_flash,
+}
+
+
+async def run_session(url: str, mix: dict, stop_at: float, think: float,
+                      auto_seconds: float, latencies: dict, errors: list):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = Session(ws, latencies, errors)
+        await session.rerun("first load")
+        while time.monotonic() < stop_at:
+            name = random.choices(names, weights)[0]
+            await SCENARIOS[name](session, think, auto_seconds)
+
+
+# ===================== SERVER + PROCESS STATS =====================
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, db_path: str, app: str = APP) -> subprocess.Popen:
+    env = dict(os.environ, CARD_DRILLS_DB=db_path)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.address", "127.0.0.1", "--browser.gatherUsageStats", "false"],
+        cwd=os.path.dirname(APP), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not become healthy within 60 s")
+
+
+def proc_stats(pid: int) -> dict:
+    """CPU seconds, thread count and RSS (bytes) of `pid`, from /proc."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    with open(f"/proc/{pid}/statm") as f:
+        rss_pages = int(f.read().split()[1])
+    return {
+        "cpu": (int(fields[11]) + int(fields[12])) / ticks,
+        "threads": int(fields[17]),
+        "rss": rss_pages * os.sysconf("SC_PAGE_SIZE"),
+    }
+
+
+async def monitor(pid: int, samples: list, stop: asyncio.Event):
+    while not stop.is_set():
+        samples.append(proc_stats(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), 0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+# ===================== RUN + REPORT =====================
+def percentiles(values: list[float]) -> dict:
+    values = sorted(values)
+    if len(values) == 1:
+        return {"p50": values[0], "p90": values[0], "p99": values[0], "max": values[0]}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98], "max": values[-1]}
+
+
+async def _load(port: int, pid: int, sessions: int, args, mix: dict) -> dict:
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    latencies, errors, samples = {}, [], []
+    idle = proc_stats(pid)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(monitor(pid, samples, stop))
+    started = time.monotonic()
+    stop_at = started + args.seconds
+    await asyncio.gather(*(
+        run_session(url, mix, stop_at, args.think, args.auto_seconds, latencies, errors)
+        for _ in range(sessions)
+    ))
+    elapsed = time.monotonic() - started
+    stop.set()
+    await sampler
+    end = proc_stats(pid)
+    samples.append(end)
+    return {
+        "sessions": sessions,
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "errors": errors,
+        "cpu_pct": 100 * (end["cpu"] - idle["cpu"]) / elapsed,
+        "threads": max(s["threads"] for s in samples),
+        "rss": max(s["rss"] for s in samples),
+        "idle_rss": idle["rss"],
+    }
+
+
+def run(sessions: int, args, mix: dict) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        port = free_port()
+        server = start_server(port, os.path.join(tmp, "load.db"))
+        try:
+            return asyncio.run(_load(port, server.pid, sessions, args, mix))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def report(result: dict, per_action: bool):
+    every = [v for values in result["latencies"].values() for v in values]
+    p = percentiles(every)
+    mb = 1024 * 1024
+    print(
+        f"{result['sessions']:>8} {len(every):>7} {len(every) / result['elapsed']:>8.1f} "
+        f"{p['p50'] * 1000:>7.0f} {p['p90'] * 1000:>7.0f} {p['p99'] * 1000:>7.0f} "
+        f"{p['max'] * 1000:>7.0f} {len(result['errors']):>6} {result['threads']:>7} "
+        f"{result['cpu_pct']:>5.0f} {result['rss'] / mb:>7.0f} "
+        f"{(result['rss'] - result['idle_rss']) / mb / result['sessions']:>9.2f}"
+    )
+    if per_action:
+        for action, values in sorted(result["latencies"].items()):
+            p = percentiles(values)
+            print(
+                f"{'':>8}   {action:<14} n={len(values):<6} p50 {p['p50'] * 1000:6.0f}  "
+                f"p90 {p['p90'] * 1000:6.0f}  p99 {p['p99'] * 1000:6.0f} ms"
+            )
+    for message in sorted(set(result["errors"]))[:3]:
+        print(f"{'':>8}   ERROR {message}")
+
+
+def parse_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", default="10",
+                        help="simulated sessions; a comma-separated list runs a sweep")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--think", type=float, default=1.0, help="mean pause between actions")
+    parser.add_argument("--auto-seconds", type=float, default=8)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--per-action", action="store_true", help="break latency down by action")
+    args = parser.parse_args(argv)
+    random.seed(args.seed)
+
+    print(f"{'sessions':>8} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>7} {'p90 ms':>7} "
+          f"{'p99 ms':>7} {'max ms':>7} {'errors':>6} {'threads':>7} {'cpu%':>5} "
+          f"{'rss MB':>7} {'MB/sess':>9}")
+    for sessions in (int(n) for n in args.sessions.split(",")):
+        report(run(sessions, args, args.mix), args.per_action)
+
+
+if __name__ == "__main__":
+    main()
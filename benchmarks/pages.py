@@ -0,0 +1,167 @@
+# benchmarks/pages.py
+"""
+Per-page rerun benchmark for card_drills.py, driven headlessly by AppTest.
+
+For each scenario (info, mn_manual, mn_manual_due with Due cards,
+mn_auto, mn_flash) it replays a few reruns of its page and records, per rerun: script time, elements emitted, total
+bytes of the rerun and bytes of markdown/HTML bodies. Medians are
+compared with a stored baseline.
+
+    python -m benchmarks.pages              # print results
+    python -m benchmarks.pages --save       # write benchmarks/baseline.json
+    python -m benchmarks.pages --check      # exit 1 on regression
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.payload import APP, rerun_payload
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Allowed growth over the baseline before --check fails.
+TOLERANCE = {"ms": 1.5, "elements": 1.0, "bytes": 1.1, "markdown_bytes": 1.1}
+
+
+def _markdown_bytes(at: AppTest) -> int:
+    return sum(len(m.value.encode()) for m in at.markdown)
+
+
+def _measure(at: AppTest, action=None) -> dict:
+    if action is not None:
+        action(at)
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    size, elements = rerun_payload(at)
+    return {
+        "ms": elapsed * 1000,
+        "elements": elements,
+        "bytes": size,
+        "markdown_bytes": _markdown_bytes(at),
+    }
+
+
+def _open(page: str) -> AppTest:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    at.session_state["page"] = page
+    return at
+
+
+def _manual_actions():
+    def new(at):
+        at.button(key="mn_manual_num_new").click()
+
+    def answer(at):
+        at.text_input(key="mn_manual_num_answer_input").input("AS")
+        at.button(key="mn_manual_num_check").click()
+
+    return [None, new, answer]
+
+
+def _manual_due_actions():
+    """Due cards, including a question drawn at random and checked after switching."""
+    def new(at):
+        at.button(key="mn_manual_num_new").click()
+
+    def due(at):
+        at.radio(key="mn_manual_pick").set_value("Due cards")
+
+    def answer(at):
+        at.text_input(key="mn_manual_num_answer_input").input("AS")
+        at.button(key="mn_manual_num_check").click()
+
+    return [None, new, due, answer, new, answer]
+
+
+def _auto_actions():
+    def start(at):
+        at.button(key="mn_auto_num_start_btn").click()
+
+    return [None, start, None]
+
+
+def _flash_actions():
+    def new(at):
+        at.button(key="mn_flash_new_bottom").click()
+
+    return [None, new, new]
+
+
+# Scenario → (page, actions).
+SCENARIOS = {
+    "info": ("info", lambda: [None, None, None]),
+    "mn_manual": ("mn_manual", _manual_actions),
+    "mn_manual_due": ("mn_manual", _manual_due_actions),
+    "mn_auto": ("mn_auto", _auto_actions),
+    "mn_flash": ("mn_flash", _flash_actions),
+}
+
+
+def run_page(scenario: str, repeat: int = 3) -> dict:
+    page, actions = SCENARIOS[scenario]
+    samples = []
+    for _ in range(repeat):
+        at = _open(page)
+        for action in actions():
+            samples.append(_measure(at, action))
+    return {
+        metric: round(statistics.median(s[metric] for s in samples), 2)
+        for metric in TOLERANCE
+    }
+
+
+def run_all(repeat: int = 3) -> dict:
+    return {scenario: run_page(scenario, repeat) for scenario in SCENARIOS}
+
+
+def regressions(results: dict, baseline: dict) -> list[str]:
+    problems = []
+    for page, metrics in results.items():
+        base = baseline.get(page)
+        if base is None:
+            continue
+        for metric, factor in TOLERANCE.items():
+            if metrics[metric] > base[metric] * factor:
+                problems.append(
+                    f"{page}.{metric}: {metrics[metric]} > {base[metric]} × {factor}"
+                )
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", action="store_true", help="store results as the baseline")
+    parser.add_argument("--check", action="store_true", help="fail if worse than the baseline")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.repeat)
+    print(f"{'scenario':<14} {'ms':>8} {'elements':>9} {'bytes':>8} {'md bytes':>9}")
+    for scenario, m in results.items():
+        print(f"{scenario:<14} {m['ms']:>8.1f} {m['elements']:>9.0f} {m['bytes']:>8.0f} {m['markdown_bytes']:>9.0f}")
+
+    if args.save:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE}")
+
+    if args.check:
+        with open(BASELINE, encoding="utf-8") as f:
+            problems = regressions(results, json.load(f))
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
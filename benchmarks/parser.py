@@ -0,0 +1,70 @@
+# benchmarks/parser.py
+"""
+Card answer parsing: the old four-replace normaliser vs the alias table.
+
+Grades a full 52-card bulk entry written in mixed notations ("10 of hearts",
+"TH", "♥10", "0h", "ace of spades", ...) and reports how many answers each
+parser accepts and the time per full entry.
+
+    python -m benchmarks.parser
+"""
+import argparse
+import random
+import timeit
+
+from cards import ALL_CARDS, RANK_ALIASES, SUIT_ALIASES, SUIT_SYMBOLS, parse_card
+
+
+def old_normalize(text: str) -> str:
+    # normalize_card_input before the alias table
+    if not text:
+        return ""
+    t = text.strip().upper().replace(" ", "")
+    t = (
+        t.replace("♠", "S")
+         .replace("♥", "H")
+         .replace("♦", "D")
+         .replace("♣", "C")
+    )
+    return t
+
+
+def bulk_entry(rng: random.Random) -> list[str]:
+    """One answer per card, each in a randomly chosen notation."""
+    answers = []
+    for card in ALL_CARDS:
+        rank, suit = card[:-1], card[-1]
+        r = rng.choice(RANK_ALIASES[rank]).lower()
+        s = rng.choice(SUIT_ALIASES[suit]).lower()
+        answers.append(rng.choice((
+            card,
+            f"{r} of {s}",
+            f"{r} {s}",
+            f"{SUIT_SYMBOLS[suit]}{rank}",
+            f"{rank}{SUIT_SYMBOLS[suit]}",
+        )))
+    return answers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    answers = bulk_entry(random.Random(args.seed))
+    pairs = list(zip(answers, ALL_CARDS))
+
+    def grade_old():
+        return sum(old_normalize(a) == card for a, card in pairs)
+
+    def grade_new():
+        return sum(parse_card(a) == card for a, card in pairs)
+
+    for label, grade in (("old normalize", grade_old), ("alias table", grade_new)):
+        seconds = min(timeit.repeat(grade, number=args.number, repeat=5)) / args.number
+        print(f"{label:<14} accepted {grade():>2}/52   {seconds * 1e6:7.1f} µs per 52-card entry")
+
+
+if __name__ == "__main__":
+    main()
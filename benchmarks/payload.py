@@ -0,0 +1,63 @@
+# benchmarks/payload.py
+"""
+Bytes sent to the browser per rerun, measured headlessly with AppTest.
+
+The size of a rerun is the serialized size of every element and block
+proto the script produced. Checks the flashcard page, where every card used
+to ship its own ~2 KB stylesheet, against a byte budget.
+
+    python -m benchmarks.payload --max-bytes 2500
+"""
+import argparse
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "card_drills.py")
+
+
+def rerun_payload(at: AppTest) -> tuple[int, int]:
+    """(bytes, elements) of the last run of `at`."""
+    def walk(node):
+        size, count = 0, 0
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            size += proto.ByteSize()
+            count += 1
+        for child in getattr(node, "children", {}).values():
+            s, c = walk(child)
+            size += s
+            count += c
+        return size, count
+
+    return walk(at._tree)
+
+
+def flashcard_payloads(reruns: int = 5) -> list[int]:
+    at = AppTest.from_file(APP, default_timeout=10).run()
+    at.session_state["page"] = "mn_flash"
+    at.run()
+    sizes = []
+    for _ in range(reruns):
+        at.button(key="mn_flash_new_bottom").click().run()
+        sizes.append(rerun_payload(at)[0])
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--max-bytes", type=int, default=2500)
+    args = parser.parse_args(argv)
+
+    sizes = flashcard_payloads(args.reruns)
+    worst = max(sizes)
+    print(f"Flashcards: bytes per rerun {sizes} (budget {args.max_bytes})")
+    if worst > args.max_bytes:
+        print("FAIL: flashcard rerun payload is over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/session_state.py
+"""
+Session-state footprint of one user who has visited every page.
+
+Drives card_drills.py headlessly (AppTest) through the manual, auto and
+flashcard pages, then reports the number of session_state entries, how
+many of them are widget values, and the deep size in bytes of the
+non-widget entries. Objects shared by all sessions (stacks, modules,
+classes, functions) are not counted.
+
+    python -m benchmarks.session_state
+"""
+import argparse
+import gc
+import sys
+import types
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.payload import APP
+from stacks import STACKS
+
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def deep_size(obj, exclude: set[int]) -> int:
+    """sys.getsizeof over everything reachable from `obj`, counting each object once."""
+    seen = set(exclude)
+    todo = [obj]
+    total = 0
+    while todo:
+        o = todo.pop()
+        if id(o) in seen or isinstance(o, _SHARED_TYPES):
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        todo.extend(gc.get_referents(o))
+    return total
+
+
+def visit_all(rounds: int = 5) -> AppTest:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+
+    at.session_state["page"] = "mn_manual"
+    at.run()
+    for drill in ("num", "card", "mixed"):
+        at.selectbox(key="mn_manual_drill_type").select_index(("num", "card", "mixed").index(drill)).run()
+        for _ in range(rounds):
+            at.button(key=f"mn_manual_{drill}_new").click().run()
+            at.text_input(key=f"mn_manual_{drill}_answer_input").input("AS")
+            at.button(key=f"mn_manual_{drill}_check").click().run()
+
+    at.session_state["page"] = "mn_auto"
+    at.run()
+    for index, drill in enumerate(("num", "card", "mixed")):
+        at.selectbox(key="mn_auto_drill_type").select_index(index).run()
+        at.button(key=f"mn_auto_{drill}_start_btn").click().run()
+        at.button(key=f"mn_auto_{drill}_stop_btn").click().run()
+
+    at.session_state["page"] = "mn_flash"
+    at.run()
+    for _ in range(rounds):
+        at.button(key="mn_flash_new_bottom").click().run()
+    return at
+
+
+def app_state(at: AppTest) -> tuple[dict, int]:
+    """(non-widget entries, number of widget entries) of `at`'s session state."""
+    state = at.session_state._state
+    values = state.filtered_state
+    mapper = state._state._key_id_mapper
+    widgets = {k for k in values if mapper.get_id_from_key(k, None) is not None}
+    return {k: v for k, v in values.items() if k not in widgets}, len(widgets)
+
+
+def measure(at: AppTest) -> dict:
+    values, widgets = app_state(at)
+    shared = {id(s) for s in (STACKS.get(name) for name in STACKS.loaded())}
+    return {
+        "widget keys": widgets,
+        "app keys": len(values),
+        "app bytes": deep_size(values, shared) - sys.getsizeof(values),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--keys", action="store_true", help="list the non-widget keys")
+    args = parser.parse_args(argv)
+
+    at = visit_all(args.rounds)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    for label, value in measure(at).items():
+        print(f"{label:<12} {value:>8}")
+    if args.keys:
+        print(", ".join(sorted(app_state(at)[0])))
+
+
+if __name__ == "__main__":
+    main()
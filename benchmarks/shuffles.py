@@ -0,0 +1,66 @@
+# benchmarks/shuffles.py
+"""
+Shuffle engine: permutation powers by squaring vs applying each repeat.
+
+Times "k out-faros" on the Mnemonica stack three ways: moving the cards
+list k times, composing the permutation k times, and power() by squaring
+(uncached and memoised), and checks that they agree.
+
+    python -m benchmarks.shuffles --times 3,52,1000
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from shuffles import operation, power
+from stacks import get_stack
+
+
+def deal_out_faros(cards: list[str], times: int) -> list[str]:
+    for _ in range(times):
+        half = len(cards) // 2
+        cards = [card for pair in zip(cards[:half], cards[half:]) for card in pair]
+    return cards
+
+
+def compose_each(times: int) -> np.ndarray:
+    result = np.arange(52)
+    base = operation("out")
+    for _ in range(times):
+        result = result[base]
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--times", default="3,52,1000", help="comma-separated repeat counts")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    stack = get_stack()
+    order = np.frombuffer(stack.order, np.uint8)
+    print(f"{'repeats':>7} {'cards us':>9} {'compose us':>11} {'squaring us':>12} {'memoised us':>12}")
+    for times in map(int, args.times.split(",")):
+        by_hand = deal_out_faros(stack.cards(), times)
+        assert [stack.cards()[i] for i in power("out", 0, times)] == by_hand
+        assert (order[compose_each(times)] == order[power("out", 0, times)]).all()
+
+        def uncached():
+            power.cache_clear()
+            return power("out", 0, times)
+
+        row = [
+            timeit.timeit(lambda: deal_out_faros(stack.cards(), times), number=args.number),
+            timeit.timeit(lambda: compose_each(times), number=args.number),
+            timeit.timeit(uncached, number=args.number),
+            timeit.timeit(lambda: power("out", 0, times), number=args.number),
+        ]
+        print(f"{times:>7} " + " ".join(
+            f"{seconds / args.number * 1e6:>{width}.1f}"
+            for seconds, width in zip(row, (9, 11, 12, 12))
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/translation.py
+"""
+Cross-stack translation: composed index vs looking the card up each time.
+
+Registers extra random stacks next to the real ones, builds the
+translation index over all of them and times a single translation
+question both ways.
+
+    python -m benchmarks.translation --stacks 2,10,50
+"""
+import argparse
+import random
+import time
+import timeit
+
+from cards import ALL_CARDS
+from stacks import STACKS, get_stack
+from translation import translation_index
+
+
+def direct(src: str, dst: str, position: int) -> int:
+    return get_stack(dst).position_of(get_stack(src).card_at(position))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stacks", default="2,10,50", help="comma-separated stack counts")
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    print(f"{'stacks':>6} {'build ms':>9} {'index ns':>9} {'direct ns':>10}")
+    for count in map(int, args.stacks.split(",")):
+        while len(STACKS.names()) < count:
+            deck = ALL_CARDS[:]
+            rng.shuffle(deck)
+            STACKS.register(f"Random {len(STACKS.names())}", lambda deck=deck: deck)
+        for name in STACKS.names():
+            get_stack(name)
+        started = time.perf_counter()
+        index = translation_index()
+        build_ms = (time.perf_counter() - started) * 1e3
+        src, dst = "Mnemonica", STACKS.names()[-1]
+        assert all(index.position(src, dst, p) == direct(src, dst, p) for p in range(1, 53))
+        indexed = timeit.timeit(lambda: translation_index().position(src, dst, 17), number=args.number)
+        looked_up = timeit.timeit(lambda: direct(src, dst, 17), number=args.number)
+        print(f"{len(STACKS.names()):>6} {build_ms:>9.2f} "
+              f"{indexed / args.number * 1e9:>9.0f} {looked_up / args.number * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
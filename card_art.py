@@ -0,0 +1,320 @@
+# card_art.py
+"""
+Playing-card faces as one SVG sprite, served from static/ by Streamlit.
+
+The sprite holds all 52 faces on a 13 × 4 grid. A small stylesheet next to
+it gives every card a class, so a card on the page is just
+`<i class=card-10H title=10♥></i>`. Both file names carry a hash of their
+content: the browser downloads them once, and every rerun after that
+sends card ids only. A <view> per card also makes `cards.<hash>.svg#10H`
+usable as an image URL.
+
+CardRenderTable pre-renders every card's markup once, for the pages.
+
+The files are build output, committed under static/: regenerate them
+after changing the art. The app only reads them, so it runs from a
+read-only checkout and several processes never race on them.
+
+    python -m card_art             # write static/cards.<hash>.{svg,css}
+    python -m card_art --check     # exit 1 if they are missing or stale
+"""
+import argparse
+import functools
+import hashlib
+import os
+import sys
+import threading
+
+from cards import ALL_CARDS, RANKS, SUITS, SUIT_SYMBOLS, card_label
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "app/static"
+
+CARD_W = 100
+CARD_H = 140
+INK = {"S": "#1a1a1a", "H": "#c62828", "D": "#c62828", "C": "#1a1a1a"}
+
+# Suit glyphs on a 20 × 20 box, drawn as paths so no font is needed.
+SUIT_PATHS = {
+    "S": '<path d="M10 1C18 8 20 12 17 15C14.5 17.5 11.5 16.5 10.7 14.5L12 19H8L9.3 14.5'
+         'C8.5 16.5 5.5 17.5 3 15C0 12 2 8 10 1Z"/>',
+    "H": '<path d="M10 18C2 12 0 7.5 2.5 4.5C5 1.5 8.5 2.5 10 5.5C11.5 2.5 15 1.5 17.5 4.5'
+         'C20 7.5 18 12 10 18Z"/>',
+    "D": '<path d="M10 1L17.5 10L10 19L2.5 10Z"/>',
+    "C": '<circle cx="10" cy="5.5" r="4.2"/><circle cx="5" cy="11.5" r="4.2"/>'
+         '<circle cx="15" cy="11.5" r="4.2"/><path d="M9.2 11L8 19H12L10.8 11Z"/>',
+}
+
+# Pip centres for number cards; pips below the middle are drawn upside down.
+_ROWS4 = (32, 57.3, 82.7, 108)
+PIPS = {
+    "A": [(50, 70)],
+    "2": [(50, 32), (50, 108)],
+    "3": [(50, 32), (50, 70), (50, 108)],
+    "4": [(x, y) for y in (32, 108) for x in (32, 68)],
+    "5": [(x, y) for y in (32, 108) for x in (32, 68)] + [(50, 70)],
+    "6": [(x, y) for y in (32, 70, 108) for x in (32, 68)],
+    "7": [(x, y) for y in (32, 70, 108) for x in (32, 68)] + [(50, 51)],
+    "8": [(x, y) for y in (32, 70, 108) for x in (32, 68)] + [(50, 51), (50, 89)],
+    "9": [(x, y) for y in _ROWS4 for x in (32, 68)] + [(50, 70)],
+    "10": [(x, y) for y in _ROWS4 for x in (32, 68)] + [(50, 44.7), (50, 95.3)],
+}
+PIP_SIZE = 15
+ACE_SIZE = 40
+
+
+def _pip(suit: str, x: float, y: float, size: float) -> str:
+    flip = f' transform="rotate(180 {x:g} {y:g})"' if y > CARD_H / 2 + 1 else ""
+    half = size / 2
+    return (
+        f'<use href="#suit-{suit}" x="{x - half:g}" y="{y - half:g}" '
+        f'width="{size:g}" height="{size:g}"{flip}/>'
+    )
+
+
+def _face(card: str, x: int, y: int) -> str:
+    """One card face with its top-left corner at (x, y) in the sprite."""
+    rank, suit = card[:-1], card[-1]
+    parts = [
+        f'<rect x="1" y="1" width="{CARD_W - 2}" height="{CARD_H - 2}" rx="8" '
+        f'fill="#fff" stroke="#d0d0d0" stroke-width="1.5"/>'
+    ]
+    fit = ' textLength="17" lengthAdjust="spacingAndGlyphs"' if len(rank) > 1 else ""
+    index = (
+        f'<text x="11" y="21" class="idx"{fit}>{rank}</text>'
+        f'<use href="#suit-{suit}" x="4" y="25" width="14" height="14"/>'
+    )
+    parts.append(index)
+    parts.append(f'<g transform="rotate(180 {CARD_W / 2:g} {CARD_H / 2:g})">{index}</g>')
+    if rank in PIPS:
+        size = ACE_SIZE if rank == "A" else PIP_SIZE
+        parts.extend(_pip(suit, px, py, size) for px, py in PIPS[rank])
+    else:
+        parts.append(
+            '<rect x="22" y="22" width="56" height="96" rx="4" fill="none" '
+            'stroke="currentColor" stroke-opacity="0.35"/>'
+            f'<text x="50" y="72" class="court">{rank}</text>'
+            + _pip(suit, 50, 92, 18)
+        )
+    return (
+        f'<g transform="translate({x},{y})" fill="{INK[suit]}" color="{INK[suit]}">'
+        + "".join(parts) + "</g>"
+    )
+
+
+def sprite_svg() -> str:
+    """The whole sprite as SVG text."""
+    cols = len(RANKS)
+    width, height = cols * CARD_W, len(SUITS) * CARD_H
+    views, faces = [], []
+    for code, card in enumerate(ALL_CARDS):
+        x, y = code % cols * CARD_W, code // cols * CARD_H
+        views.append(f'<view id="{card}" viewBox="{x} {y} {CARD_W} {CARD_H}"/>')
+        faces.append(_face(card, x, y))
+    symbols = "".join(
+        f'<symbol id="suit-{suit}" viewBox="0 0 20 20">{path}</symbol>'
+        for suit, path in SUIT_PATHS.items()
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}">'
+        "<style>text{font-family:Georgia,'Times New Roman',serif;font-weight:700;"
+        "text-anchor:middle}.idx{font-size:19px}.court{font-size:44px}</style>"
+        f"<defs>{symbols}</defs>{''.join(views)}{''.join(faces)}</svg>\n"
+    )
+
+
+def sprite_css(sprite_name: str) -> str:
+    """
+    One class per card that shows its cell of the sprite. Sizes and positions
+    are percentages, so a card scales with the height its container sets.
+    """
+    cols, rows = len(RANKS), len(SUITS)
+    rules = [
+        ",".join(f".card-{card}" for card in ALL_CARDS)
+        + f"{{display:inline-block;height:120px;aspect-ratio:{CARD_W}/{CARD_H};"
+        f"vertical-align:middle;background:url({sprite_name}) 0 0/"
+        f"{cols * 100}% {rows * 100}% no-repeat}}"
+    ]
+    for code, card in enumerate(ALL_CARDS):
+        x, y = code % cols * 100 / (cols - 1), code // cols * 100 / (rows - 1)
+        rules.append(f".card-{card}{{background-position:{x:.4g}% {y:.4g}%}}")
+    return "\n".join(rules) + "\n"
+
+
+@functools.cache
+def _assets() -> tuple[str, str, str]:
+    """(hash, sprite, stylesheet), generated the first time they are needed."""
+    svg = sprite_svg()
+    asset_hash = hashlib.sha256((svg + sprite_css("")).encode()).hexdigest()[:10]
+    return asset_hash, svg, sprite_css(f"cards.{asset_hash}.svg")
+
+
+def asset_names() -> tuple[str, str]:
+    """File names of the current sprite and stylesheet."""
+    asset_hash = _assets()[0]
+    return f"cards.{asset_hash}.svg", f"cards.{asset_hash}.css"
+
+
+def __getattr__(name):
+    # The names carry the content hash, so asking for one builds the whole
+    # sprite; that is left to the first import that needs them.
+    if name == "ASSET_HASH":
+        return _assets()[0]
+    if name == "SPRITE_NAME":
+        return asset_names()[0]
+    if name == "STYLESHEET_NAME":
+        return asset_names()[1]
+    if name == "STYLESHEET_URL":
+        return f"{STATIC_URL}/{asset_names()[1]}"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def missing_assets(static_dir: str = STATIC_DIR) -> list[str]:
+    """Names of the current sprite and stylesheet files that are not in `static_dir`."""
+    return [name for name in asset_names()
+            if not os.path.exists(os.path.join(static_dir, name))]
+
+
+def write_assets(static_dir: str = STATIC_DIR) -> str:
+    """Build step: write the current sprite and stylesheet and drop stale ones."""
+    os.makedirs(static_dir, exist_ok=True)
+    _, svg, css = _assets()
+    sprite_name, stylesheet_name = asset_names()
+    current = {sprite_name: svg, stylesheet_name: css}
+    for name, text in current.items():
+        path = os.path.join(static_dir, name)
+        with open(path + ".part", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(path + ".part", path)
+    for name in os.listdir(static_dir):
+        if name.startswith("cards.") and name not in current:
+            os.remove(os.path.join(static_dir, name))
+    return os.path.join(static_dir, sprite_name)
+
+
+def format_card(card: str) -> str:
+    """Self-contained text card (coloured rank and suit), for HTML outside the app."""
+    rank = card[:-1]
+    suit = card[-1]
+    symbol = SUIT_SYMBOLS[suit]
+    color = "red" if suit in ["H", "D"] else "black"
+    return (
+        f"<span style='font-size:2.4rem;"
+        f"color:{color};font-weight:700'>{rank}{symbol}</span>"
+    )
+
+
+def card_html(card: str) -> str:
+    """
+    A card face by id: needs the stylesheet at STYLESHEET_URL on the page.
+    Attributes are unquoted (neither value has spaces) to keep reruns small.
+    """
+    return f"<i class=card-{card} title={card_label(card)}></i>"
+
+
+# ===================== RENDER TABLE =====================
+def card_box_html(content_html: str, title: str | None = None) -> str:
+    """
+    Playing-card style box with optional title and inner HTML content.
+    """
+    title_html = (
+        f"<div style='font-size:0.8rem;color:#666;margin-bottom:0.25rem;'>{title}</div>"
+        if title
+        else ""
+    )
+    return f"""
+    <div style="
+        display:inline-block;
+        padding:1.5rem 2rem;
+        border-radius:0.9rem;
+        border:2px solid #e0e0e0;
+        background:linear-gradient(135deg,#ffffff,#f7f7f7);
+        box-shadow:0 6px 16px rgba(0,0,0,0.15);
+        text-align:center;
+        min-width:150px;
+    ">
+        {title_html}
+        <div style="font-size:2.7rem;line-height:1;">
+            {content_html}
+        </div>
+    </div>
+    """
+
+
+# Card faces come from the sprite above: the markup is only the card id,
+# and containers size it through their own CSS.
+CARD_RENDERERS = {
+    "inline": card_html,
+    "face": card_html,
+    "box": lambda card: card_box_html(card_html(card)),
+}
+
+
+class CardRenderTable:
+    """
+    Every card pre-rendered in every variant, built once per process and
+    read-only after that, so script threads share it without a lock.
+    Lookups are a single dict hit; unknown cards are rendered each time.
+    Hits and misses are counted per thread and summed by `stats()`.
+    """
+
+    def __init__(self, cards=ALL_CARDS):
+        self._table = {
+            variant: {card: render(card) for card in cards}
+            for variant, render in CARD_RENDERERS.items()
+        }
+        self._local = threading.local()
+        self._counters = []
+        self._lock = threading.Lock()
+
+    def _counts(self) -> list[int]:
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = [0, 0]
+            with self._lock:
+                self._counters.append(counts)
+        return counts
+
+    def get(self, card: str, variant: str = "inline") -> str:
+        html = self._table[variant].get(card)
+        counts = self._counts()
+        if html is None:
+            counts[1] += 1
+            return CARD_RENDERERS[variant](card)
+        counts[0] += 1
+        return html
+
+    def hit_rate(self) -> float:
+        return self.stats()["hit_rate"]
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = sum(counts[0] for counts in self._counters)
+            misses = sum(counts[1] for counts in self._counters)
+        total = hits + misses
+        return {
+            "entries": sum(len(cards) for cards in self._table.values()),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the card sprite and stylesheet.")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the current files are in static/")
+    args = parser.parse_args(argv)
+    if args.check:
+        missing = missing_assets()
+        for name in missing:
+            print(f"MISSING static/{name}: run python -m card_art")
+        if missing:
+            sys.exit(1)
+        return
+    print(write_assets())
+
+
+if __name__ == "__main__":
+    main()
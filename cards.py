@@ -0,0 +1,119 @@
+# cards.py
+import string
+
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+SUITS = ["S", "H", "D", "C"]
+SUIT_SYMBOLS = {"S": "♠", "H": "♥", "D": "♦", "C": "♣"}
+
+# Card codes 0–51: suit-major, so code = suit_index * 13 + rank_index.
+ALL_CARDS = [rank + suit for suit in SUITS for rank in RANKS]
+CARD_CODE = {card: code for code, card in enumerate(ALL_CARDS)}
+
+
+def card_label(card: str) -> str:
+    """Plain-text card for places without HTML ("10H" → "10♥")."""
+    return card[:-1] + SUIT_SYMBOLS[card[-1]]
+
+# ===================== ANSWER PARSING =====================
+# Accepted spellings, after uppercasing and dropping spaces/punctuation.
+RANK_ALIASES = {
+    "A": ("A", "ACE", "1"),
+    "2": ("2", "TWO", "DEUCE"),
+    "3": ("3", "THREE", "TREY"),
+    "4": ("4", "FOUR"),
+    "5": ("5", "FIVE"),
+    "6": ("6", "SIX"),
+    "7": ("7", "SEVEN"),
+    "8": ("8", "EIGHT"),
+    "9": ("9", "NINE"),
+    "10": ("10", "T", "TEN", "0"),
+    "J": ("J", "JACK", "KNAVE"),
+    "Q": ("Q", "QUEEN"),
+    "K": ("K", "KING"),
+}
+SUIT_ALIASES = {
+    "S": ("S", "SPADE", "SPADES"),
+    "H": ("H", "HEART", "HEARTS"),
+    "D": ("D", "DIAMOND", "DIAMONDS"),
+    "C": ("C", "CLUB", "CLUBS"),
+}
+
+# One str.translate pass for answers that are not a key as typed (after
+# strip().upper()): suit symbols (filled and outline) to letters, and drop
+# whitespace, separators and emoji variation selectors.
+_TRANSLATE = str.maketrans(
+    {
+        "♠": "S", "♤": "S", "♥": "H", "♡": "H",
+        "♦": "D", "♢": "D", "♣": "C", "♧": "C",
+        **{c: None for c in string.whitespace + "-_.,/️"},
+    }
+)
+
+
+def _build_aliases() -> dict[str, tuple[str, ...]]:
+    """
+    Every accepted spelling → the cards it can mean, in card-code order:
+    rank+suit ("10H", "TENOFHEARTS"), suit+rank ("H10"), and a bare rank or
+    suit, which names several cards and is therefore ambiguous. Spellings
+    with single spaces ("TEN OF HEARTS") or a filled suit symbol ("♥10")
+    are keys too, so the usual answers need no translate pass.
+    """
+    table = {}
+
+    def add(key, cards):
+        table.setdefault(key, set()).update(cards)
+
+    for rank, rank_names in RANK_ALIASES.items():
+        for suit, suit_names in SUIT_ALIASES.items():
+            card = rank + suit
+            for r in rank_names:
+                for s in suit_names + (SUIT_SYMBOLS[suit],):
+                    for sep in ("", " "):
+                        add(r + sep + s, (card,))
+                        add(s + sep + r, (card,))
+                        add(r + sep + "OF" + sep + s, (card,))
+    for rank, rank_names in RANK_ALIASES.items():
+        for r in rank_names:
+            add(r, [rank + suit for suit in SUITS])
+    for suit, suit_names in SUIT_ALIASES.items():
+        for s in suit_names:
+            add(s, [rank + suit for rank in RANKS])
+    return {key: tuple(sorted(cards, key=CARD_CODE.__getitem__)) for key, cards in table.items()}
+
+
+_ALIASES = _build_aliases()
+
+
+def _lookup(text: str):
+    key = text.strip().upper()
+    cards = _ALIASES.get(key)
+    if cards is None:
+        key = key.translate(_TRANSLATE)
+        cards = _ALIASES.get(key)
+    return key, cards
+
+
+def match_card(text: str) -> tuple[str, ...]:
+    """
+    Cards an answer can mean: one for a valid answer, several when it is
+    ambiguous (e.g. "10" or "hearts"), none when it is not a card.
+    """
+    if not text:
+        return ()
+    return _lookup(text)[1] or ()
+
+
+def parse_card(text: str) -> str | None:
+    """The card an answer names ("10 of hearts", "TH", "♥10", "0h" → "10H"), or None."""
+    if not text:
+        return None
+    cards = _lookup(text)[1]
+    return cards[0] if cards is not None and len(cards) == 1 else None
+
+
+def normalize_card_input(text: str) -> str:
+    """Canonical code for a recognised card, else the cleaned-up text."""
+    if not text:
+        return ""
+    key, cards = _lookup(text)
+    return cards[0] if cards is not None and len(cards) == 1 else key
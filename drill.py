@@ -0,0 +1,137 @@
+# drill.py
+"""
+Drill a stack in the terminal: no browser and no Streamlit, so it starts
+in a few tens of milliseconds and works fine over SSH.
+
+Type the answer and press Enter; an empty line reveals the answer, `q`
+(or Ctrl-D / Ctrl-C) ends the session and prints the summary. With
+--seconds the session is a sprint against the clock.
+
+    python -m drill                               # Number → Card, whole Mnemonica
+    python -m drill --mode card --start 1 --end 13
+    python -m drill --mode mixed --stack Aronson --seconds 60
+"""
+import argparse
+import sys
+import time
+
+from cards import card_label, match_card
+from engine import DRILL_MODES, MODE_NAMES, NUM_TO_CARD, DrillEngine
+from scheduler import Scheduler
+from stacks import STACKS, get_stack
+
+QUIT = ("q", "quit", "exit")
+
+
+def _label(card: str) -> str:
+    """Suit symbols where the terminal can print them, plain codes elsewhere."""
+    label = card_label(card)
+    try:
+        label.encode(sys.stdout.encoding or "ascii")
+    except UnicodeEncodeError:
+        return card
+    return label
+
+
+def _prompt(question) -> str:
+    if question.direction == NUM_TO_CARD:
+        return f"{question.position:>2} → card? "
+    return f"{_label(question.card):>3} → position? "
+
+
+def _answer(question) -> str:
+    if question.direction == NUM_TO_CARD:
+        return _label(question.card)
+    return str(question.position)
+
+
+def run(engine: DrillEngine, start: int, end: int, count: int | None = None,
+        seconds: float | None = None, scheduler: Scheduler | None = None,
+        read=input, write=print):
+    """
+    Ask questions until `count` are answered, `seconds` have passed, or
+    the user quits. With a `scheduler`, questions come from the cards it
+    says are due and every answer is graded into it.
+    """
+    deadline = None if seconds is None else time.monotonic() + seconds
+    asked = 0
+    while count is None or asked < count:
+        if scheduler is None:
+            question = engine.new_question(start, end)
+        else:
+            question = engine.due_question(scheduler, start, end)
+        shown = time.monotonic()
+        try:
+            text = read(_prompt(question)).strip()
+        except (EOFError, KeyboardInterrupt):
+            write("")
+            break
+        latency_ms = round((time.monotonic() - shown) * 1000)
+        if text.lower() in QUIT:
+            break
+        if deadline is not None and shown + latency_ms / 1000 > deadline:
+            write("   ⏱ time's up")
+            break
+        asked += 1
+        if not text:
+            engine.record(False, None)
+            write(f"   → {_answer(question)}")
+            ok = False
+        else:
+            ok = engine.check(text, latency_ms)
+            if ok:
+                write(f"   ✓ {latency_ms / 1000:.1f} s")
+            elif question.direction == NUM_TO_CARD and len(match_card(text)) > 1:
+                write(f"   ? “{text}” could be several cards – it is {_answer(question)}")
+            else:
+                write(f"   ✗ {_answer(question)}")
+        if scheduler is not None:
+            scheduler.grade(engine.review_key(question), ok)
+
+
+def summary(engine: DrillEngine) -> str:
+    """
+    Accuracy over every question, reveals counting as misses. Speed is over
+    typed answers only (the ones with a latency), and the rate is left out
+    until they add up to a second.
+    """
+    if not engine.attempts:
+        return "No answers."
+    parts = [f"{engine.correct}/{engine.attempts} right ({engine.accuracy() * 100:.0f}%)"]
+    revealed = engine.attempts - engine.timed
+    if revealed:
+        parts.append(f"{revealed} revealed, counted as misses")
+    mean = engine.mean_latency()
+    if mean is not None:
+        parts.append(f"{mean / 1000:.1f} s per typed answer")
+    if engine.latency_total >= 1000:
+        parts.append(f"{engine.timed / (engine.latency_total / 60_000):.0f} answers a minute")
+    return ", ".join(parts) + "."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=list(DRILL_MODES), default="num",
+                        help="num: Number → Card, card: Card → Number, mixed: both")
+    parser.add_argument("--stack", choices=STACKS.names(), default="Mnemonica")
+    parser.add_argument("--start", type=int, default=1)
+    parser.add_argument("--end", type=int, default=52)
+    parser.add_argument("--count", type=int, help="stop after this many questions")
+    parser.add_argument("--seconds", type=float, help="timed: stop when the time is up")
+    parser.add_argument("--due", action="store_true",
+                        help="favour the cards you miss instead of a shuffled pass")
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.start <= args.end <= 52:
+        parser.error("Start position must be ≤ end position.")
+    engine = DrillEngine(DRILL_MODES[args.mode], get_stack(args.stack))
+    limit = f", {args.seconds:g} s" if args.seconds else ""
+    print(f"{args.stack} · {MODE_NAMES[args.mode]} · positions {args.start}–{args.end}{limit}"
+          " · Enter reveals, q quits")
+    run(engine, args.start, args.end, args.count, args.seconds,
+        Scheduler() if args.due else None)
+    print(summary(engine))
+
+
+if __name__ == "__main__":
+    main()
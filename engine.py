@@ -0,0 +1,158 @@
+# engine.py
+import random
+import time
+
+from cards import parse_card
+from sampler import ShuffleBag
+from scheduler import review_key
+from stacks import Stack, get_stack
+
+NUM_TO_CARD = "num_to_card"
+CARD_TO_NUM = "card_to_num"
+MIXED = "mixed"
+DIRECTIONS = (NUM_TO_CARD, CARD_TO_NUM)
+# Short drill names used by the pages' session state and the terminal drill.
+DRILL_MODES = {"num": NUM_TO_CARD, "card": CARD_TO_NUM, "mixed": MIXED}
+MODE_NAMES = {"num": "Number → Card", "card": "Card → Number", "mixed": "Mixed"}
+
+
+class Question:
+    __slots__ = ("direction", "position", "card", "shown_at", "pick")
+
+    def __init__(self, direction: str, position: int, card: str):
+        self.direction = direction
+        self.position = position
+        self.card = card
+        self.shown_at = time.time()
+        self.pick = None  # how the UI picked it (mnemonica.due), graded accordingly
+
+    @property
+    def answer(self) -> str:
+        return self.card if self.direction == NUM_TO_CARD else str(self.position)
+
+    def __repr__(self) -> str:
+        return f"Question({self.direction!r}, {self.position}, {self.card!r})"
+
+
+def parse_position(text) -> int | None:
+    try:
+        return int(text.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+class DrillEngine:
+    """
+    Question generation, grading and counters for one drill, without any UI.
+
+    `mode` is NUM_TO_CARD, CARD_TO_NUM or MIXED (both directions, evenly).
+    Positions are 1-based and ranges inclusive, as in the UI. `new_question`
+    walks a shuffle bag, so a range of N positions is fully covered in N
+    questions; the bag starts over when the range changes.
+    """
+
+    __slots__ = ("stack", "mode", "rng", "bag", "question", "attempts", "correct",
+                 "timed", "latency_total", "last_latency")
+
+    def __init__(self, mode: str = NUM_TO_CARD, stack: Stack | None = None,
+                 rng: random.Random | None = None):
+        if mode not in (NUM_TO_CARD, CARD_TO_NUM, MIXED):
+            raise ValueError(f"Unknown drill mode: {mode!r}")
+        self.stack = stack or get_stack()
+        self.mode = mode
+        # The module-level generator is shared, so engines kept in session
+        # state do not each carry ~2.5 KB of Mersenne Twister state.
+        self.rng = rng or random
+        self.bag = None
+        self.question = None
+        self.attempts = 0
+        self.correct = 0
+        self.timed = 0
+        self.latency_total = 0
+        self.last_latency = None
+
+    def new_question(self, start: int = 1, end: int = 52) -> Question:
+        if not 1 <= start <= end <= len(self.stack):
+            raise ValueError("Start position must be ≤ end position.")
+        mixed = self.mode == MIXED
+        bag = self.bag
+        if bag is None or not bag.covers(start, end, mixed):
+            bag = self.bag = ShuffleBag(start, end, mixed, self.rng)
+        position, flip = bag.draw()
+        direction = DIRECTIONS[flip] if mixed else self.mode
+        self.question = Question(direction, position, self.stack.card_at(position))
+        return self.question
+
+    def due_question(self, scheduler, start: int = 1, end: int = 52) -> Question:
+        """
+        Next question from a spaced-repetition `scheduler.Scheduler`: the
+        earliest-due card in the range (either direction in MIXED mode).
+        """
+        if not 1 <= start <= end <= len(self.stack):
+            raise ValueError("Start position must be ≤ end position.")
+        stack = self.stack
+        cards = [stack.card_at(p) for p in range(start, end + 1)]
+        directions = DIRECTIONS if self.mode == MIXED else (self.mode,)
+
+        def in_range(card):
+            return start <= stack.position_of(card) <= end
+
+        best = None
+        for direction in directions:
+            scheduler.ensure(stack.name, direction, cards, self.rng)
+            candidate = scheduler.peek(stack.name, direction, in_range)
+            if candidate is None:
+                continue
+            # Ties (e.g. brand-new items) are split at random between directions.
+            if (best is None or candidate[1] < best[1]
+                    or (candidate[1] == best[1] and self.rng.random() < 0.5)):
+                best = candidate
+        _, direction, card = best[0]
+        self.question = Question(direction, stack.position_of(card), card)
+        return self.question
+
+    def review_key(self, question: Question | None = None) -> tuple:
+        question = question or self.question
+        return review_key(self.stack.name, question.direction, question.card)
+
+    def grade(self, answer: str, question: Question | None = None) -> bool:
+        """Whether `answer` is right for `question` (default: the current one)."""
+        question = question or self.question
+        if question.direction == NUM_TO_CARD:
+            return parse_card(answer) == question.card
+        return parse_position(answer) == question.position
+
+    def check(self, answer: str, latency_ms: int | None = None) -> bool:
+        """
+        Grade the current question and count the attempt. `latency_ms` is
+        the response time, when the UI could measure it.
+        """
+        ok = self.grade(answer)
+        self.record(ok, latency_ms)
+        return ok
+
+    def record(self, ok: bool, latency_ms: int | None = None):
+        """Count an attempt graded elsewhere (e.g. one answer of a browser batch)."""
+        self.attempts += 1
+        if ok:
+            self.correct += 1
+        if latency_ms is not None:
+            self.timed += 1
+            self.latency_total += latency_ms
+            self.last_latency = latency_ms
+
+    def accuracy(self) -> float | None:
+        return self.correct / self.attempts if self.attempts else None
+
+    def mean_latency(self) -> float | None:
+        """Mean response time in ms over the timed attempts."""
+        return self.latency_total / self.timed if self.timed else None
+
+    def reset(self):
+        self.bag = None
+        self.question = None
+        self.attempts = 0
+        self.correct = 0
+        self.timed = 0
+        self.latency_total = 0
+        self.last_latency = None
@@ -0,0 +1,270 @@
+# exporter.py
+"""
+Offline material for every registered stack (stacks.STACKS):
+
+- <stack>-cheatsheet.html   one printable page: position → card and
+                            card → position tables
+- <stack>-flashcards.html   two-sided sheets to print duplex (flip on the
+                            long edge) and cut: position on the front, the
+                            card face on the back
+- <stack>-anki.csv          both directions as Anki notes (File → Import)
+- <stack>.apkg              the same deck as an Anki package; needs the
+                            optional `genanki` package
+
+The HTML files are self-contained, so "Print → Save as PDF" in any browser
+gives the PDF. Files are written as they are generated, and stacks are
+exported in parallel processes.
+
+    python -m exporter                       # every stack, every format, into export/
+    python -m exporter --stack Aronson --format csv --out /tmp/decks
+"""
+import argparse
+import base64
+import csv
+import os
+import time
+import zlib
+
+from card_art import format_card, sprite_css, sprite_svg
+from cards import RANKS, SUIT_SYMBOLS, SUITS, card_label
+from engine import CARD_TO_NUM, NUM_TO_CARD, Question
+from stacks import STACKS, get_stack
+
+try:
+    import genanki
+except ImportError:  # .apkg export is optional
+    genanki = None
+
+DEFAULT_OUT = "export"
+FORMATS = ("cheatsheet", "flashcards", "csv", "apkg")
+SHEET_COLUMNS = 3  # 3 × 3 poker-size (63 × 88 mm) cards per A4 page, as in PRINT_CSS
+SHEET_ROWS = 3
+CHEAT_COLUMNS = 4
+
+PRINT_CSS = """
+@page { size: A4; margin: 10mm; }
+* { -webkit-print-color-adjust: exact; print-color-adjust: exact; }
+body { font-family: "Source Sans Pro", Helvetica, Arial, sans-serif; color: #31333f; margin: 0; }
+h1 { font-size: 1.3rem; margin: 0 0 0.4rem; }
+h2 { font-size: 1rem; margin: 0.8rem 0 0.3rem; }
+table { border-collapse: collapse; }
+td, th { padding: 0.05rem 0.5rem; }
+.pos { color: #777; font-family: monospace; text-align: right; }
+.cheat span { font-size: 1.15rem !important; }
+.sheet { page-break-after: always; break-after: page; display: grid;
+         grid-template-columns: repeat(3, 63mm); grid-auto-rows: 88mm; justify-content: center; }
+.sheet:last-child { page-break-after: auto; break-after: auto; }
+.cell { border: 0.2mm dashed #bbb; display: flex; align-items: center; justify-content: center;
+        flex-direction: column; }
+.cell b { font-size: 3rem; }
+.cell small { color: #999; font-size: 0.7rem; margin-top: 0.4rem; }
+.cell i { height: 72mm; }
+"""
+
+
+# ===================== PAIRS =====================
+def questions(stack, direction: str) -> list[Question]:
+    """The drill pairs of a stack in one direction, in stack order."""
+    return [
+        Question(direction, position, stack.card_at(position))
+        for position in range(1, len(stack) + 1)
+    ]
+
+
+def _side(question: Question) -> tuple[str, str]:
+    """(front, back) HTML of one Anki note, as the drills ask it."""
+    position = f"<b style='font-size:2.4rem'>{question.position}</b>"
+    card = format_card(question.card)
+    if question.direction == NUM_TO_CARD:
+        return position, card
+    return card, position
+
+
+# ===================== HTML =====================
+def _page(title: str, css: str):
+    yield (
+        f"<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>{title}</title>"
+        f"<style>{PRINT_CSS}{css}</style></head><body>\n"
+    )
+
+
+def cheatsheet_html(stack):
+    """Both lookup tables on one page, positions running down each column."""
+    yield from _page(f"{stack.name} cheat sheet", "")
+    yield f"<div class='cheat'><h1>{stack.name}</h1><h2>Position → Card</h2><table>"
+    rows = -(-len(stack) // CHEAT_COLUMNS)
+    for row in range(rows):
+        cells = []
+        for col in range(CHEAT_COLUMNS):
+            position = col * rows + row + 1
+            if position <= len(stack):
+                cells.append(
+                    f"<td class='pos'>{position}</td><td>{format_card(stack.card_at(position))}</td>"
+                )
+        yield f"<tr>{''.join(cells)}</tr>\n"
+    yield "</table><h2>Card → Position</h2><table><tr><th></th>"
+    yield "".join(
+        f"<th style='color:{'red' if suit in 'HD' else 'black'}'>{SUIT_SYMBOLS[suit]}</th>"
+        for suit in SUITS
+    )
+    yield "</tr>\n"
+    for rank in RANKS:
+        cells = "".join(
+            f"<td class='pos'>{stack.position_of(rank + suit)}</td>" for suit in SUITS
+        )
+        yield f"<tr><th>{rank}</th>{cells}</tr>\n"
+    yield "</table></div></body></html>\n"
+
+
+def flashcard_sheets_html(stack):
+    """
+    Fronts and backs on alternate pages. Each back page mirrors its front
+    page's columns, so the card behind every position lines up when the
+    sheet is printed on both sides and flipped on the long edge.
+    """
+    sprite = base64.b64encode(sprite_svg().encode()).decode()
+    yield from _page(f"{stack.name} flashcards", sprite_css(f"data:image/svg+xml;base64,{sprite}"))
+    per_sheet = SHEET_COLUMNS * SHEET_ROWS
+    for first in range(1, len(stack) + 1, per_sheet):
+        positions = range(first, min(first + per_sheet, len(stack) + 1))
+        yield "<div class='sheet'>"
+        for position in positions:
+            yield f"<div class='cell'><b>{position}</b><small>{stack.name}</small></div>"
+        yield "</div>\n<div class='sheet'>"
+        for row in range(SHEET_ROWS):
+            for col in reversed(range(SHEET_COLUMNS)):
+                index = row * SHEET_COLUMNS + col
+                if index < len(positions):
+                    card = stack.card_at(positions[index])
+                    yield f"<div class='cell'><i class=card-{card} title={card_label(card)}></i></div>"
+                else:
+                    yield "<div class='cell' style='border:none'></div>"
+        yield "</div>\n"
+    yield "</body></html>\n"
+
+
+# ===================== ANKI =====================
+def _tags(stack, question: Question) -> str:
+    return f"{stack.name.lower()} {question.direction}"
+
+
+def write_anki_csv(stack, path: str):
+    """Anki's text import with file headers: Front, Back, Tags, one row per pair."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(
+            "#separator:Comma\n#html:true\n#notetype:Basic\n"
+            f"#deck:Stacks::{stack.name}\n#tags column:3\n"
+        )
+        writer = csv.writer(f)
+        for direction in (NUM_TO_CARD, CARD_TO_NUM):
+            for question in questions(stack, direction):
+                writer.writerow((*_side(question), _tags(stack, question)))
+
+
+def _anki_id(*parts) -> int:
+    """Stable id, so re-importing a deck updates it instead of duplicating it."""
+    return (1 << 31) + zlib.crc32(":".join(map(str, parts)).encode())
+
+
+def write_apkg(stack, path: str):
+    model = genanki.Model(
+        _anki_id("card-drills-model"),
+        "Card Drills",
+        fields=[{"name": "Front"}, {"name": "Back"}],
+        templates=[{
+            "name": "Card",
+            "qfmt": "{{Front}}",
+            "afmt": "{{FrontSide}}<hr id=answer>{{Back}}",
+        }],
+        css=".card { text-align: center; font-family: Helvetica, Arial, sans-serif; }",
+    )
+    deck = genanki.Deck(_anki_id("deck", stack.name), f"Stacks::{stack.name}")
+    for direction in (NUM_TO_CARD, CARD_TO_NUM):
+        for question in questions(stack, direction):
+            deck.add_note(genanki.Note(
+                model=model,
+                fields=list(_side(question)),
+                tags=_tags(stack, question).split(),
+                guid=genanki.guid_for(stack.name, direction, question.position),
+            ))
+    genanki.Package(deck).write_to_file(path)
+
+
+# ===================== EXPORT =====================
+def _html_writer(render):
+    def write(stack, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(render(stack))
+    return write
+
+
+# Format → (file suffix, writer(stack, path)).
+WRITERS = {
+    "cheatsheet": ("-cheatsheet.html", _html_writer(cheatsheet_html)),
+    "flashcards": ("-flashcards.html", _html_writer(flashcard_sheets_html)),
+    "csv": ("-anki.csv", write_anki_csv),
+    "apkg": (".apkg", write_apkg),
+}
+
+
+def export_stack(name: str, out_dir: str, formats=FORMATS) -> list[str]:
+    """
+    Write the chosen formats for one stack; returns the paths written.
+    Each file is streamed to a .part file and renamed once complete.
+    """
+    stack = get_stack(name)
+    os.makedirs(out_dir, exist_ok=True)
+    slug = name.lower().replace(" ", "-")
+    written = []
+    for fmt in formats:
+        if fmt == "apkg" and genanki is None:
+            continue
+        suffix, write = WRITERS[fmt]
+        path = os.path.join(out_dir, slug + suffix)
+        write(stack, path + ".part")
+        os.replace(path + ".part", path)
+        written.append(path)
+    return written
+
+
+def export_all(names=None, out_dir: str = DEFAULT_OUT, formats=FORMATS, jobs: int | None = None):
+    """
+    Export several stacks, one process each (up to `jobs`). Yields
+    (stack name, paths) as each stack finishes.
+    """
+    names = list(names or STACKS.names())
+    jobs = min(jobs or os.cpu_count() or 1, len(names))
+    if jobs <= 1:
+        for name in names:
+            yield name, export_stack(name, out_dir, formats)
+        return
+    # multiprocessing is a slow import; single-stack runs never need it.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(export_stack, name, out_dir, formats): name for name in names}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stack", action="append", choices=STACKS.names(),
+                        help="stack to export (repeatable; default: all)")
+    parser.add_argument("--format", action="append", choices=FORMATS,
+                        help="format to write (repeatable; default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT)
+    parser.add_argument("--jobs", type=int, help="parallel processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    formats = args.format or FORMATS
+    if "apkg" in formats and genanki is None:
+        print("Skipping .apkg: pip install genanki to enable it.")
+    started = time.perf_counter()
+    for name, paths in export_all(args.stack, args.out, formats, args.jobs):
+        print(f"{name}: " + ", ".join(os.path.basename(path) for path in paths))
+    print(f"Done in {time.perf_counter() - started:.2f} s → {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
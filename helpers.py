@@ -1,37 +1,84 @@
-import time
+# helpers.py
+"""
+Streamlit-bound helpers for the pages: the shared card table, stylesheet
+injection, fragments and reruns. Anything that does not need Streamlit
+lives in the core modules (cards, card_art, timers, engine, ...).
+"""
+import functools
+import json
+import logging
+
 import streamlit as st
 
-def format_card(card: str) -> str:
-    rank = card[:-1]
-    suit = card[-1]
-    symbol = {"S": "♠", "H": "♥", "D": "♦", "C": "♣"}[suit]
-    color = "red" if suit in ["H", "D"] else "black"
-    return (
-        f"<span style='font-size:2.4rem;"
-        f"color:{color};font-weight:700'>{rank}{symbol}</span>"
-    )
+from card_art import STYLESHEET_URL, CardRenderTable, missing_assets
+from profiling import rerun_profile
+
+@st.cache_resource
+def card_render_table() -> CardRenderTable:
+    for name in missing_assets():
+        logging.getLogger(__name__).warning(
+            "static/%s is missing, cards will not show: run python -m card_art", name)
+    return CardRenderTable()
+
+_TABLE = None
+
+def render_card(card: str, variant: str = "inline") -> str:
+    # Bind the shared table once: going through st.cache_resource on every
+    # call costs more than rendering the card from scratch.
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = card_render_table()
+    return _TABLE.get(card, variant)
+
+def inject_css(name: str, css: str):
+    """
+    Add a stylesheet to the page <head> once per session.
+
+    A <style> sent through st.markdown disappears with its element, so it has
+    to be re-sent on every rerun. This writes it into the parent document
+    instead, from a zero-height component, and remembers that it did.
+    """
+    _inject_head(name, "style", f"style.textContent = {json.dumps(css)};")
 
-def normalize_card_input(text: str) -> str:
-    if not text:
-        return ""
-    t = text.strip().upper().replace(" ", "")
-    t = (
-        t.replace("♠", "S")
-         .replace("♥", "H")
-         .replace("♦", "D")
-         .replace("♣", "C")
+def inject_stylesheet(name: str, href: str):
+    """Like inject_css, for a stylesheet served as a file (e.g. from app/static/)."""
+    _inject_head(name, "link", f'style.rel = "stylesheet"; style.href = {json.dumps(href)};')
+
+def card_stylesheet():
+    """The card sprite's stylesheet, needed by everything render_card returns."""
+    inject_stylesheet("cards", STYLESHEET_URL)
+
+def _inject_head(name: str, tag: str, setup_js: str):
+    injected = st.session_state.setdefault("_injected_css", set())
+    if name in injected:
+        return
+    style_id = json.dumps(f"card-drills-{name}")
+    html_frame(
+        f"""<script>
+const doc = window.parent.document;
+if (!doc.getElementById({style_id})) {{
+  const style = doc.createElement("{tag}");
+  style.id = {style_id};
+  {setup_js}
+  doc.head.appendChild(style);
+}}
+</script>""",
+        height=0,
     )
-    return t
-
-def countdown(seconds: int, label: str):
-    placeholder = st.empty()
-    for i in range(seconds, 0, -1):
-        placeholder.markdown(f"⏳ **{label}: {i}**")
-        time.sleep(1)
-    placeholder.empty()
-
-def rerun():
-    if hasattr(st, "rerun"):
-        st.rerun()
-    else:
-        st.experimental_rerun()
+    injected.add(name)
+
+def html_frame(html: str, height: int):
+    # st.iframe has no zero height; "content" collapses an empty frame.
+    st.iframe(html, height=height or "content")
+
+def fragment(func=None, *, run_every=None):
+    if func is None:
+        return functools.partial(fragment, run_every=run_every)
+
+    # Fragment reruns skip the routing block, so they are profiled here.
+    @functools.wraps(func)
+    def body(*args, **kwargs):
+        with rerun_profile(f"fragment {func.__name__}"):
+            return func(*args, **kwargs)
+
+    return st.fragment(body, run_every=run_every)
@@ -0,0 +1,28 @@
+# info.py
+import streamlit as st
+
+from profiling import profiled
+
+
+@profiled
+def show_info():
+    st.title("📘 Information")
+    st.markdown(
+        """
+This app helps you train **memorized deck stacks**.
+
+Currently included:
+
+- 🧠 **Mnemonica** by Juan Tamariz  
+
+Modes:
+
+- **Manual drills** – you click *New question* when ready.  
+- **Auto drills** – timed, hands-free practice with *Start / Stop / New session*.  
+- **Mixed drills** – combines both directions (Number ↔ Card) randomly.  
+- **Flashcards** – visual, flip-style practice with no typing.
+- **Rapid fire** – type answers against the clock; right answers advance instantly.
+- **Translation drills** – a position in one stack → where that card sits in another.
+- **After the shuffle** – drill a stack as it is after cuts, faros, deals or reversals.
+"""
+    )
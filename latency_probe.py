@@ -0,0 +1,35 @@
+# latency_probe.py
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "latency_probe")
+_component = components.declare_component("latency_probe", path=_FRONTEND)
+
+
+def latency_probe(question_id: str, button_key: str, key: str | None = None) -> dict | None:
+    """
+    Time from showing a question to pressing its check button, measured in
+    the browser (so network and rerun time are not included).
+
+    The clock restarts whenever `question_id` changes. The probe takes over
+    clicks on the button keyed `button_key`: a press sends `{"qid", "ms",
+    "press"}` instead of the button's own rerun, and this returns it on
+    that rerun only, so a non-None result means "checked". The button
+    still works by itself (e.g. without JavaScript, or from AppTest).
+    """
+    value = _component(qid=question_id, button_key=button_key,
+                       key=key, default=None)
+    seen_key = f"{key}_press"
+    if value is None or value.get("press") == st.session_state.get(seen_key):
+        return None
+    st.session_state[seen_key] = value.get("press")
+    return value
+
+
+def latency_for(timing: dict | None, question_id: str) -> int | None:
+    """Milliseconds from `timing` if it belongs to `question_id`."""
+    if timing and timing.get("qid") == question_id:
+        return int(timing["ms"])
+    return None
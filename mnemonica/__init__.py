@@ -0,0 +1,20 @@
+# mnemonica/__init__.py
+"""
+Mnemonica pages. Each page lives in its own module and is only imported
+the first time it is asked for, so a rerun only pays for the visible page.
+"""
+import importlib
+
+_PAGES = {
+    "render_manual": "mnemonica.manual",
+    "render_auto": "mnemonica.auto",
+    "render_flashcards": "mnemonica.flashcards",
+    "render_rapid": "mnemonica.rapid",
+    "render_stats": "mnemonica.stats",
+}
+
+
+def __getattr__(name):
+    if name in _PAGES:
+        return getattr(importlib.import_module(_PAGES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
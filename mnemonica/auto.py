@@ -0,0 +1,422 @@
+# mnemonica/auto.py
+import time
+
+import streamlit as st
+
+from auto_player import auto_player, new_batch_id
+from engine import NUM_TO_CARD, Question
+from helpers import card_stylesheet, fragment, render_card
+from mnemonica.due import make_batch, next_question, pick_selector, record_seen
+from mnemonica.history import log_attempt
+from mnemonica.stack_view import stack_view
+from mnemonica.state import AutoDrill, AutoState
+from profiling import profiled
+from timers import REVEAL, THINK, countdown_label
+
+# ===================== AUTO DRILLS (THINK ONLY) =====================
+AUTO_LIVE = "Live (server)"
+AUTO_BATCH = "Batch (browser)"
+
+@profiled
+def render_auto():
+    ss = st.session_state
+
+    # Auto state: running flag, rounds, think/reveal cycle (see timers.AutoCycle)
+    # and engine for each drill type
+    if "mn_auto" not in ss:
+        ss.mn_auto = AutoState()
+
+    st.title("🧠 Mnemonica – Auto drills")
+    card_stylesheet()
+
+    drill_type = st.selectbox(
+        "Drill type",
+        ["Number → Card", "Card → Number", "Mixed"],
+        key="mn_auto_drill_type",
+    )
+    pick_selector("mn_auto_pick")
+
+    st.radio(
+        "Player",
+        [AUTO_LIVE, AUTO_BATCH],
+        horizontal=True,
+        key="mn_auto_player",
+        help="Batch mode sends a whole set of questions to your browser at once "
+        "and plays them there, without waiting on the server between questions.",
+    )
+
+    st.markdown(
+        "In auto mode you **never type**:\n\n"
+        "- A question appears.\n"
+        "- You get a countdown (your chosen interval) to **think of the answer**.\n"
+        "- The app then shows the **correct answer**.\n"
+        "- Short pause, then the **next question** starts automatically.\n"
+    )
+    st.divider()
+
+    if drill_type == "Number → Card":
+        _auto_number_to_card(ss)
+    elif drill_type == "Card → Number":
+        _auto_card_to_number(ss)
+    else:
+        _auto_mixed(ss)
+
+    st.markdown("---")
+    stack_view()
+
+
+# ---------- AUTO: NUMBER → CARD (think only) ----------
+@profiled
+def _auto_number_to_card(ss):
+    col1, col2 = st.columns(2)
+    with col1:
+        start = st.number_input(
+            "Start position", 1, 52, 1, key="mn_auto_num_start"
+        )
+    with col2:
+        end = st.number_input(
+            "End position", 1, 52, 52, key="mn_auto_num_end"
+        )
+
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    drill = ss.mn_auto.num
+    drill.cycle.think_seconds = st.number_input(
+        "Thinking time (seconds)",
+        min_value=1,
+        max_value=60,
+        value=drill.cycle.think_seconds,
+        key="mn_auto_num_interval_input",
+    )
+
+    if ss.mn_auto_player == AUTO_BATCH:
+        _auto_batch(ss, "num", drill, start, end)
+        return
+
+    colc1, colc2, colc3 = st.columns(3)
+    with colc1:
+        if st.button("▶ Start session", key="mn_auto_num_start_btn"):
+            drill.running = True
+            drill.cycle.stop()
+            st.rerun()
+    with colc2:
+        if st.button("⏹ Stop session", key="mn_auto_num_stop_btn"):
+            drill.running = False
+            drill.cycle.stop()
+            st.rerun()
+    with colc3:
+        if st.button("🔄 Reset counter", key="mn_auto_num_reset_btn"):
+            drill.rounds = 0
+            st.rerun()
+
+    st.markdown(
+        f"**Status:** {'🟢 Running' if drill.running else '🔴 Stopped'}  "
+        f"• Thinking time: `{drill.cycle.think_seconds}` seconds"
+    )
+
+    if not drill.running:
+        return
+
+    _auto_number_to_card_tick(ss, start, end)
+
+
+@fragment(run_every=1)
+def _auto_number_to_card_tick(ss, start, end):
+    # Reruns on its own every second; only redraws, never sleeps.
+    drill = ss.mn_auto.num
+    cycle = drill.cycle
+    engine = drill.engine
+    event = cycle.tick()
+    if event == THINK:
+        question = next_question(engine, start, end, ss.mn_auto_pick)
+        record_seen(engine, question)
+        drill.rounds += 1
+    elif event == REVEAL:
+        log_attempt(engine, engine.question, "auto")
+
+    pos, card = engine.question.position, engine.question.card
+
+    st.markdown(f"### Position: `{pos}`  _(range {start}–{end})_")
+    st.caption(f"Auto questions this session: `{drill.rounds}`")
+
+    st.info("Look at the position and **think of the card** in Mnemonica.")
+
+    if cycle.phase == THINK:
+        st.markdown(countdown_label(cycle.remaining(), "Think for"))
+        return
+
+    st.success("✅ Time! The card at this position is:")
+    st.markdown(render_card(card), unsafe_allow_html=True)
+
+    st.markdown(countdown_label(cycle.remaining(), "Next position in"))
+
+
+# ---------- AUTO: CARD → NUMBER (think only) ----------
+@profiled
+def _auto_card_to_number(ss):
+    col1, col2 = st.columns(2)
+    with col1:
+        card_start = st.number_input(
+            "Start position (range)", 1, 52, 1, key="mn_auto_card_start"
+        )
+    with col2:
+        card_end = st.number_input(
+            "End position (range)", 1, 52, 52, key="mn_auto_card_end"
+        )
+
+    if card_start > card_end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    drill = ss.mn_auto.card
+    drill.cycle.think_seconds = st.number_input(
+        "Thinking time (seconds)",
+        min_value=1,
+        max_value=60,
+        value=drill.cycle.think_seconds,
+        key="mn_auto_card_interval_input",
+    )
+
+    if ss.mn_auto_player == AUTO_BATCH:
+        _auto_batch(ss, "card", drill, card_start, card_end)
+        return
+
+    colc1, colc2, colc3 = st.columns(3)
+    with colc1:
+        if st.button("▶ Start session", key="mn_auto_card_start_btn"):
+            drill.running = True
+            drill.cycle.stop()
+            st.rerun()
+    with colc2:
+        if st.button("⏹ Stop session", key="mn_auto_card_stop_btn"):
+            drill.running = False
+            drill.cycle.stop()
+            st.rerun()
+    with colc3:
+        if st.button("🔄 Reset counter", key="mn_auto_card_reset_btn"):
+            drill.rounds = 0
+            st.rerun()
+
+    st.markdown(
+        f"**Status:** {'🟢 Running' if drill.running else '🔴 Stopped'}  "
+        f"• Thinking time: `{drill.cycle.think_seconds}` seconds"
+    )
+
+    if not drill.running:
+        return
+
+    _auto_card_to_number_tick(ss, card_start, card_end)
+
+
+@fragment(run_every=1)
+def _auto_card_to_number_tick(ss, card_start, card_end):
+    drill = ss.mn_auto.card
+    cycle = drill.cycle
+    engine = drill.engine
+    event = cycle.tick()
+    if event == THINK:
+        question = next_question(engine, card_start, card_end, ss.mn_auto_pick)
+        record_seen(engine, question)
+        drill.rounds += 1
+    elif event == REVEAL:
+        log_attempt(engine, engine.question, "auto")
+
+    pos, card = engine.question.position, engine.question.card
+
+    st.markdown("### Current card:")
+    st.markdown(render_card(card), unsafe_allow_html=True)
+    st.markdown(f"_Range: positions {card_start}–{card_end}_")
+    st.caption(f"Auto questions this session: `{drill.rounds}`")
+
+    st.info("Look at the card and **think of its Mnemonica position**.")
+
+    if cycle.phase == THINK:
+        st.markdown(countdown_label(cycle.remaining(), "Think for"))
+        return
+
+    st.success("✅ Time! The position of this card is:")
+    st.markdown(f"**Position:** `{pos}`")
+
+    st.markdown(countdown_label(cycle.remaining(), "Next card in"))
+
+
+# ---------- AUTO: MIXED (think only) ----------
+@profiled
+def _auto_mixed(ss):
+    col1, col2 = st.columns(2)
+    with col1:
+        mixed_start = st.number_input(
+            "Start position (range for mixed)", 1, 52, 1, key="mn_auto_mixed_start"
+        )
+    with col2:
+        mixed_end = st.number_input(
+            "End position (range for mixed)", 1, 52, 52, key="mn_auto_mixed_end"
+        )
+
+    if mixed_start > mixed_end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    drill = ss.mn_auto.mixed
+    drill.cycle.think_seconds = st.number_input(
+        "Thinking time (seconds)",
+        min_value=1,
+        max_value=60,
+        value=drill.cycle.think_seconds,
+        key="mn_auto_mixed_interval_input",
+    )
+
+    if ss.mn_auto_player == AUTO_BATCH:
+        _auto_batch(ss, "mixed", drill, mixed_start, mixed_end)
+        return
+
+    colc1, colc2, colc3 = st.columns(3)
+    with colc1:
+        if st.button("▶ Start session", key="mn_auto_mixed_start_btn"):
+            drill.running = True
+            drill.cycle.stop()
+            st.rerun()
+    with colc2:
+        if st.button("⏹ Stop session", key="mn_auto_mixed_stop_btn"):
+            drill.running = False
+            drill.cycle.stop()
+            st.rerun()
+    with colc3:
+        if st.button("🔄 Reset counter", key="mn_auto_mixed_reset_btn"):
+            drill.rounds = 0
+            st.rerun()
+
+    st.markdown(
+        f"**Status:** {'🟢 Running' if drill.running else '🔴 Stopped'}  "
+        f"• Thinking time: `{drill.cycle.think_seconds}` seconds"
+    )
+
+    if not drill.running:
+        return
+
+    _auto_mixed_tick(ss, mixed_start, mixed_end)
+
+
+@fragment(run_every=1)
+def _auto_mixed_tick(ss, mixed_start, mixed_end):
+    drill = ss.mn_auto.mixed
+    cycle = drill.cycle
+    engine = drill.engine
+    event = cycle.tick()
+    if event == THINK:
+        # The engine picks Number→Card or Card→Number at random
+        question = next_question(engine, mixed_start, mixed_end, ss.mn_auto_pick)
+        record_seen(engine, question)
+        drill.rounds += 1
+    elif event == REVEAL:
+        log_attempt(engine, engine.question, "auto")
+
+    pos, card = engine.question.position, engine.question.card
+
+    if engine.question.direction == NUM_TO_CARD:
+        st.markdown(f"### Mixed auto – Position: `{pos}`")
+        st.caption(
+            f"(Range: {mixed_start}–{mixed_end}, expect a **card** in your head)"
+        )
+        st.info("Look at the position and **think of the card**.")
+
+        if cycle.phase != THINK:
+            st.success("✅ Time! The card at this position is:")
+            st.markdown(render_card(card), unsafe_allow_html=True)
+
+    else:
+        st.markdown("### Mixed auto – Card:")
+        st.markdown(render_card(card), unsafe_allow_html=True)
+        st.caption(
+            f"(Range: {mixed_start}–{mixed_end}, expect a **position** in your head)"
+        )
+        st.info("Look at the card and **think of its Mnemonica position**.")
+
+        if cycle.phase != THINK:
+            st.success("✅ Time! The position of this card is:")
+            st.markdown(f"**Position:** `{pos}`")
+
+    st.caption(f"Mixed auto questions this session: `{drill.rounds}`")
+
+    if cycle.phase == THINK:
+        st.markdown(countdown_label(cycle.remaining(), "Think for"))
+    else:
+        st.markdown(countdown_label(cycle.remaining(), "Next mixed drill in"))
+
+
+# ---------- AUTO: BROWSER BATCH (any direction) ----------
+def _batch_payload(questions: list[Question]) -> list[dict]:
+    payload = []
+    for question in questions:
+        if question.direction == NUM_TO_CARD:
+            payload.append({
+                "title": "Position → think of the card",
+                "question": f"<strong>{question.position}</strong>",
+                "answer": render_card(question.card),
+            })
+        else:
+            payload.append({
+                "title": "Card → think of its position",
+                "question": render_card(question.card),
+                "answer": f"<strong>{question.position}</strong>",
+            })
+    return payload
+
+
+def _log_batch(drill: AutoDrill, questions: list[Question], result: dict):
+    """
+    Log the shown questions with the times the player showed them: each
+    one's shown_at is rebuilt from its offset into the batch, and it ends
+    when the next one (or the batch) does. Results without offsets are
+    logged with no times of their own, only when the batch came back.
+    """
+    ended = time.time()
+    started = ended - result["ms"] / 1000
+    offsets = result.get("offsets") or []
+    shown = questions[:result["shown"]]
+    for i, question in enumerate(shown):
+        if i < len(offsets):
+            question.shown_at = started + offsets[i] / 1000
+            end = started + offsets[i + 1] / 1000 if i + 1 < len(offsets) else ended
+        else:
+            question.shown_at = end = ended
+        log_attempt(drill.engine, question, "auto", answered_at=end)
+
+
+@profiled
+def _auto_batch(ss, name: str, drill: AutoDrill, start: int, end: int):
+    """
+    Generate N questions once and hand them to the browser player.
+    The server is only involved again when the batch reports back.
+    """
+    prefix = f"mn_auto_{name}"
+    size = st.number_input(
+        "Questions per batch", 1, 200, 20, key=f"{prefix}_batch_size"
+    )
+
+    if st.button("▶ Start batch", key=f"{prefix}_batch_btn"):
+        questions = make_batch(drill.engine, start, end, size, ss.mn_auto_pick)
+        drill.batch = (new_batch_id(), questions, _batch_payload(questions))
+
+    st.caption(f"Auto questions this session: `{drill.rounds}`")
+
+    if drill.batch is None:
+        return
+
+    batch_id, questions, payload = drill.batch
+    result = auto_player(
+        payload,
+        batch_id=batch_id,
+        think_seconds=drill.cycle.think_seconds,
+        key=f"{prefix}_player",
+    )
+
+    if result and result["id"] == batch_id:
+        drill.rounds += result["shown"]
+        _log_batch(drill, questions, result)
+        drill.batch = None
+        st.success(
+            f"Batch done: {result['shown']} questions in {result['ms'] / 1000:.0f} s."
+        )
@@ -0,0 +1,90 @@
+# mnemonica/due.py
+"""
+Question selection shared by the manual, auto and flashcard pages:
+a shuffled pass over the range (no repeats until every position has come
+up), or the cards the spaced-repetition scheduler says are due.
+"""
+import streamlit as st
+
+from engine import DrillEngine, Question
+from mnemonica.history import attempt_store, user_id
+from scheduler import Scheduler, review_key
+from stacks import get_stack
+
+PICK_RANDOM = "Random"
+PICK_DUE = "Due cards"
+PICK_OPTIONS = [PICK_RANDOM, PICK_DUE]
+
+
+def scheduler(stack_name: str) -> Scheduler:
+    """
+    The session's scheduler, shared by all pages and directions. The first
+    time the session drills a stack, the user's logged answers on it are
+    replayed into it, so boxes and due dates outlast the session.
+    """
+    ss = st.session_state
+    if "mn_scheduler" not in ss:
+        ss.mn_scheduler = Scheduler()
+        ss.mn_scheduler_stacks = set()
+    if stack_name not in ss.mn_scheduler_stacks:
+        ss.mn_scheduler_stacks.add(stack_name)
+        ss.mn_scheduler.replay(_logged_answers(stack_name))
+    return ss.mn_scheduler
+
+
+def _logged_answers(stack_name: str):
+    stack = get_stack(stack_name)
+    rows = attempt_store().history(user_id(), stack_name)
+    for _, direction, position, correct, _, answered_at in rows:
+        if correct is not None:
+            card = stack.card_at(position)
+            yield review_key(stack_name, direction, card), bool(correct), answered_at
+
+
+def pick_selector(key: str) -> str:
+    return st.radio(
+        "Pick questions",
+        PICK_OPTIONS,
+        horizontal=True,
+        key=key,
+        help="Random goes through the whole range in shuffled order before repeating. "
+             "Due cards favours the cards you miss and spaces out the ones you know.",
+    )
+
+
+def next_question(engine: DrillEngine, start: int, end: int, pick: str) -> Question:
+    """
+    The next question by `pick`. The question remembers its picker, so it
+    is graded the way it was drawn even if the radio changes meanwhile.
+    """
+    if pick == PICK_DUE:
+        question = engine.due_question(scheduler(engine.stack.name), start, end)
+    else:
+        question = engine.new_question(start, end)
+    question.pick = pick
+    return question
+
+
+def make_batch(engine: DrillEngine, start: int, end: int, size: int,
+               pick: str) -> list[Question]:
+    """
+    `size` questions up front, for drills that play in the browser. Each
+    one is pushed back as seen, so due picks do not repeat the same card.
+    """
+    questions = []
+    for _ in range(size):
+        question = next_question(engine, start, end, pick)
+        record_seen(engine, question)
+        questions.append(question)
+    return questions
+
+
+def record_answer(engine: DrillEngine, question: Question, correct: bool):
+    if question.pick == PICK_DUE:
+        scheduler(engine.stack.name).grade(engine.review_key(question), correct)
+
+
+def record_seen(engine: DrillEngine, question: Question):
+    """Reveal-only modes: push the card back without grading it."""
+    if question.pick == PICK_DUE:
+        scheduler(engine.stack.name).touch(engine.review_key(question))
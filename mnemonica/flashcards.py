@@ -0,0 +1,266 @@
+# mnemonica/flashcards.py
+import streamlit as st
+
+from card_art import card_box_html
+from engine import CARD_TO_NUM, MIXED, NUM_TO_CARD
+from helpers import card_stylesheet, inject_css, render_card
+from mnemonica.due import PICK_DUE, next_question, pick_selector, record_answer, record_seen
+from mnemonica.history import log_attempt
+from mnemonica.state import FlashState
+from profiling import profiled
+
+# ---------- FLIP CARD ----------
+FLIP_CARD_CSS = """
+.flip-wrapper {
+  display: flex;
+  justify-content: center;
+  margin: 1.5rem 0;
+}
+.flip-container {
+  display: inline-block;
+  perspective: 1200px;
+  cursor: pointer;
+}
+.flip-checkbox {
+  display: none;
+}
+.flip-card {
+  position: relative;
+  width: 220px;
+  height: 300px;
+  transform-style: preserve-3d;
+  transition: transform 0.6s ease;
+}
+.flip-checkbox:checked + .flip-card {
+  transform: rotateY(180deg);
+}
+.flip-face {
+  position: absolute;
+  width: 100%;
+  height: 100%;
+  backface-visibility: hidden;
+  border-radius: 12px;
+  border: 2px solid #e0e0e0;
+  box-shadow: 0 6px 16px rgba(0,0,0,0.18);
+  background: linear-gradient(135deg,#ffffff,#f7f7f7);
+  display: flex;
+  flex-direction: column;
+  align-items: center;
+  justify-content: center;
+  padding: 0.75rem;
+}
+.flip-back {
+  transform: rotateY(180deg);
+}
+.flip-title {
+  font-size: 0.8rem;
+  color: #777;
+  margin-bottom: 0.25rem;
+  text-transform: uppercase;
+  letter-spacing: 0.04em;
+}
+.flip-content {
+  font-size: 2.4rem;
+  line-height: 1.1;
+}
+.flip-content i {
+  height: 200px;
+}
+"""
+
+NEW_CARD_BUTTON_CSS = """
+.st-key-mn_flash_new_bottom {
+  display: flex;
+  justify-content: center;
+  margin-top: -0.5rem;
+}
+.st-key-mn_flash_new_bottom button {
+  width: 220px !important;
+  height: 44px;
+  background: linear-gradient(135deg, #fafafa, #f3f3f3);
+  border: 1px solid #ddd;
+  border-radius: 10px;
+  box-shadow: 0 3px 8px rgba(0,0,0,0.08);
+  font-size: 1rem;
+  font-weight: 500;
+  cursor: pointer;
+  transition: all 0.2s ease;
+}
+.st-key-mn_flash_new_bottom button:hover {
+  background: linear-gradient(135deg, #ffffff, #f9f9f9);
+  box-shadow: 0 4px 10px rgba(0,0,0,0.15);
+  transform: translateY(-1px);
+}
+"""
+
+
+@profiled
+def _render_flip_card(question_html: str, answer_html: str,
+                      question_label: str, answer_label: str, card_id: str = "mn_flash"):
+    """
+    Render a CSS flip card: front = question, back = answer.
+    Click to flip. Pure HTML+CSS (no JS), using a hidden checkbox.
+    The stylesheet is injected once per session (see FLIP_CARD_CSS);
+    `card_id` only makes each new card a fresh, unflipped element.
+    """
+    inject_css("flip-card", FLIP_CARD_CSS)
+    html = f"""
+<div class="flip-wrapper" data-card="{card_id}">
+  <label class="flip-container">
+    <input type="checkbox" class="flip-checkbox">
+    <div class="flip-card">
+      <div class="flip-face flip-front">
+        <div class="flip-title">{question_label}</div>
+        <div class="flip-content">{question_html}</div>
+      </div>
+      <div class="flip-face flip-back">
+        <div class="flip-title">{answer_label}</div>
+        <div class="flip-content">{answer_html}</div>
+      </div>
+    </div>
+  </label>
+</div>
+"""
+    st.markdown(html, unsafe_allow_html=True)
+
+# ---------- VISUAL CARD HELPERS (for flashcards) ----------
+@profiled
+def _render_card_box(content_html: str, title: str | None = None):
+    """
+    Renders a playing-card style box with optional title and inner HTML content.
+    """
+    st.markdown(card_box_html(content_html, title), unsafe_allow_html=True)
+
+
+@profiled
+def _render_position_card(position: int):
+    """
+    Render a big number styled as a 'position card'.
+    """
+    html = f"<span style='font-weight:700;color:#333;'>{position}</span>"
+    _render_card_box(html, title="Position")
+
+
+# ===================== FLASHCARDS =====================
+FLASH_MODES = {
+    "Number → Card": NUM_TO_CARD,
+    "Card → Number": CARD_TO_NUM,
+    "Mixed": MIXED,
+}
+
+
+@profiled
+def render_flashcards():
+    ss = st.session_state
+
+    # Flashcards state
+    if "mn_flash" not in ss:
+        ss.mn_flash = FlashState()
+    state = ss.mn_flash
+
+    st.title("🧠 Mnemonica – Flashcards")
+    card_stylesheet()
+
+    st.markdown(
+        """
+Flashcards mode helps you **visually memorize** the Mnemonica stack.
+
+Each flashcard has two sides:
+- Front → the **question** (position or card)  
+- Back → the **answer**  
+
+Click the card itself to flip it with an animation.
+"""
+    )
+    st.divider()
+
+    # ---------- Mode + Range ----------
+    main_mode = st.radio(
+        "Flashcard mode",
+        ("Number → Card", "Card → Number", "Mixed"),
+        horizontal=True,
+        key="mn_flash_main_mode_select",
+    )
+    pick = pick_selector("mn_flash_pick")
+    engine = state.engine
+    engine.mode = FLASH_MODES[main_mode]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        start = st.number_input("Start position", 1, 52, 1, key="mn_flash_start")
+    with col2:
+        end = st.number_input("End position", 1, 52, 52, key="mn_flash_end")
+
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    # ---------- Controls Row ----------
+    colb1, colb2 = st.columns([1, 1])
+    with colb1:
+        reset_clicked = st.button("🔄 Reset counter", key="mn_flash_reset")
+
+    if reset_clicked:
+        state.counter = 0
+        engine.question = None
+
+    st.markdown(f"**Cards reviewed this session:** `{state.counter}`")
+    st.markdown("---")
+
+    # ---------- Flashcard Rendering ----------
+    # If no card yet → generate first one automatically
+    if engine.question is None:
+        state.counter += 1
+        next_question(engine, start, end, pick)
+
+    # Prepare card content
+    question = engine.question
+    if question.direction == NUM_TO_CARD:
+        question_html = f"<strong>{question.position}</strong>"
+        answer_html = render_card(question.card, "face")
+        question_label = "Position"
+        answer_label = "Card"
+    else:
+        question_html = render_card(question.card, "face")
+        answer_html = f"<strong>{question.position}</strong>"
+        question_label = "Card"
+        answer_label = "Position"
+
+    card_id = f"mn_flash_{state.counter}"
+
+    # Render centered flip card
+    _render_flip_card(
+        question_html=question_html,
+        answer_html=answer_html,
+        question_label=question_label,
+        answer_label=answer_label,
+        card_id=card_id,
+    )
+
+    # ---------- Self-grading (due cards only) ----------
+    if pick == PICK_DUE:
+        colg1, colg2 = st.columns(2)
+        with colg1:
+            knew = st.button("✅ Knew it", key="mn_flash_knew")
+        with colg2:
+            missed = st.button("❌ Missed it", key="mn_flash_missed")
+        if knew or missed:
+            record_answer(engine, question, knew)
+            log_attempt(engine, question, "flash", correct=knew)
+            state.counter += 1
+            next_question(engine, start, end, pick)
+            st.rerun()
+
+    # ---------- Bottom Centered "New Card" ----------
+    inject_css("new-card-button", NEW_CARD_BUTTON_CSS)
+
+    # Real working Streamlit button (centered, same width as card)
+    new_clicked = st.button("🎴 New card", key="mn_flash_new_bottom", help="Show next flashcard", type="secondary")
+
+    # Handle button logic
+    if new_clicked:
+        record_seen(engine, question)
+        log_attempt(engine, question, "flash")
+        state.counter += 1
+        next_question(engine, start, end, pick)
+        st.rerun()
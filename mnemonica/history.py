@@ -0,0 +1,54 @@
+# mnemonica/history.py
+"""
+Attempt history for the Mnemonica pages, written to the shared SQLite store.
+"""
+import os
+import uuid
+
+import streamlit as st
+
+from engine import DrillEngine, Question
+from store import AttemptStore
+
+DB_PATH = os.environ.get(
+    "CARD_DRILLS_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "attempts.db"),
+)
+
+
+@st.cache_resource
+def attempt_store() -> AttemptStore:
+    return AttemptStore(DB_PATH)
+
+
+def user_id() -> str:
+    """
+    Anonymous per-browser id. It is kept in the URL (?user=...), so the
+    history follows the user across refreshes and server restarts.
+    """
+    ss = st.session_state
+    if "mn_user" not in ss:
+        uid = st.query_params.get("user")
+        if not uid:
+            uid = uuid.uuid4().hex[:12]
+            st.query_params["user"] = uid
+        ss.mn_user = uid
+    return ss.mn_user
+
+
+def log_attempt(engine: DrillEngine, question: Question, mode: str,
+                answer: str | None = None, correct: bool | None = None,
+                latency_ms: int | None = None, answered_at: float | None = None):
+    attempt_store().record(
+        user_id(),
+        engine.stack.name,
+        mode,
+        question.direction,
+        question.position,
+        question.card,
+        answer,
+        correct,
+        question.shown_at,
+        answered_at,
+        latency_ms=latency_ms,
+    )
@@ -0,0 +1,250 @@
+# mnemonica/manual.py
+import streamlit as st
+
+from cards import card_label, match_card
+from engine import NUM_TO_CARD, DrillEngine, Question
+from helpers import card_stylesheet, render_card
+from latency_probe import latency_for, latency_probe
+from mnemonica.due import next_question, pick_selector, record_answer
+from mnemonica.history import log_attempt
+from mnemonica.stack_view import stack_view
+from mnemonica.state import ManualState
+from profiling import profiled
+
+# ===================== MANUAL DRILLS =====================
+@profiled
+def render_manual():
+    ss = st.session_state
+
+    # Per-mode state (manual): one headless engine per drill type
+    if "mn_manual" not in ss:
+        ss.mn_manual = ManualState()
+
+    st.title("🧠 Mnemonica – Manual drills")
+    card_stylesheet()
+
+    drill_type = st.selectbox(
+        "Drill type",
+        ["Number → Card", "Card → Number", "Mixed"],
+        key="mn_manual_drill_type",
+    )
+    pick_selector("mn_manual_pick")
+
+    st.markdown("Click **New question** whenever you’re ready for the next drill.")
+    st.divider()
+
+    if drill_type == "Number → Card":
+        _manual_number_to_card(ss)
+    elif drill_type == "Card → Number":
+        _manual_card_to_number(ss)
+    else:
+        _manual_mixed(ss)
+
+    st.markdown("---")
+    stack_view()
+
+
+def _question_id(question: Question) -> str:
+    return f"{question.shown_at:.6f}"
+
+
+def _manual_timing(question: Question, check_key: str):
+    """
+    Browser-side response timer for the question answered with `check_key`;
+    returns the timing only on the rerun of a press (see latency_probe).
+    """
+    return latency_probe(_question_id(question), check_key, key=f"{check_key}_timer")
+
+
+@profiled
+def _manual_check(ss, engine: DrillEngine, question: Question, answer: str, timing=None):
+    latency_ms = latency_for(timing, _question_id(question))
+    ok = engine.check(answer, latency_ms)
+    record_answer(engine, question, ok)
+    log_attempt(engine, question, "manual", answer, ok, latency_ms)
+    _manual_feedback(ok, question, answer)
+
+
+def _manual_feedback(ok: bool, question: Question, answer: str = ""):
+    if ok:
+        st.success("✅ Correct!")
+    elif question.direction == NUM_TO_CARD:
+        if len(match_card(answer)) > 1:
+            st.warning(f"“{answer}” could be several cards – give both rank and suit.")
+        st.error(f"❌ Incorrect. Correct card is: **{card_label(question.card)}**")
+    else:
+        st.error(f"❌ Incorrect. Correct position is: `{question.position}`")
+
+
+@profiled
+def _manual_stats(engine: DrillEngine, attempts_label: str = "Attempts",
+                  accuracy_label: str = "Accuracy"):
+    attempts = engine.attempts
+    correct = engine.correct
+    st.markdown("---")
+    col_s1, col_s2, col_s3 = st.columns(3)
+    with col_s1:
+        st.metric(attempts_label, attempts)
+    with col_s2:
+        if attempts > 0:
+            pct = engine.accuracy() * 100
+            st.metric(accuracy_label, f"{correct}/{attempts}", f"{pct:.0f}%")
+        else:
+            st.metric(accuracy_label, "–", "+0%")
+    with col_s3:
+        mean = engine.mean_latency()
+        if mean is not None:
+            st.metric("Avg response", f"{mean / 1000:.1f} s",
+                      f"last {engine.last_latency / 1000:.1f} s", delta_color="off")
+        else:
+            st.metric("Avg response", "–")
+
+
+@profiled
+def _manual_number_to_card(ss):
+    engine = ss.mn_manual.num
+    col1, col2 = st.columns(2)
+    with col1:
+        start = st.number_input("Start position", 1, 52, 1, key="mn_manual_num_start")
+    with col2:
+        end = st.number_input("End position", 1, 52, 52, key="mn_manual_num_end")
+
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("🎲 New question", key="mn_manual_num_new"):
+        next_question(engine, start, end, ss.mn_manual_pick)
+        # safe: before text_input instantiation
+        ss["mn_manual_num_answer_input"] = ""
+
+    question = engine.question
+    if question is not None:
+        st.markdown(f"### Position: `{question.position}`  _(range {start}–{end})_")
+        st.info("Say the card at this position, then type it below or reveal it.")
+
+        with st.expander("Reveal card"):
+            st.markdown(render_card(question.card), unsafe_allow_html=True)
+
+        ans = st.text_input(
+            "Your answer (e.g. AS, 4C, QH)",
+            key="mn_manual_num_answer_input",
+        )
+
+        timing = _manual_timing(question, "mn_manual_num_check")
+        if st.button("Check answer", key="mn_manual_num_check") or timing:
+            _manual_check(ss, engine, question, ans, timing)
+
+        _manual_stats(engine)
+
+
+@profiled
+def _manual_card_to_number(ss):
+    engine = ss.mn_manual.card
+    col1, col2 = st.columns(2)
+    with col1:
+        card_start = st.number_input(
+            "Start position (range)", 1, 52, 1, key="mn_manual_card_start"
+        )
+    with col2:
+        card_end = st.number_input(
+            "End position (range)", 1, 52, 52, key="mn_manual_card_end"
+        )
+
+    if card_start > card_end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("🎴 New question", key="mn_manual_card_new"):
+        next_question(engine, card_start, card_end, ss.mn_manual_pick)
+        ss["mn_manual_card_answer_input"] = ""
+
+    question = engine.question
+    if question is not None:
+        st.markdown("### Current card:")
+        st.markdown(render_card(question.card), unsafe_allow_html=True)
+        st.markdown(f"_Range: positions {card_start}–{card_end}_")
+
+        st.info("Say the position in Mnemonica, then type it below or reveal it.")
+
+        with st.expander("Reveal position"):
+            st.markdown(f"**Position:** `{question.position}`")
+
+        ans_num = st.text_input(
+            "Your answer (position 1–52)",
+            key="mn_manual_card_answer_input",
+        )
+
+        timing = _manual_timing(question, "mn_manual_card_check")
+        if st.button("Check position", key="mn_manual_card_check") or timing:
+            _manual_check(ss, engine, question, ans_num, timing)
+
+        _manual_stats(engine)
+
+
+@profiled
+def _manual_mixed(ss):
+    """
+    Randomly choose Number→Card OR Card→Number for each question.
+    User answers appropriately; stats combined.
+    """
+    engine = ss.mn_manual.mixed
+    col1, col2 = st.columns(2)
+    with col1:
+        mixed_start = st.number_input(
+            "Start position (range for mixed)", 1, 52, 1, key="mn_manual_mixed_start"
+        )
+    with col2:
+        mixed_end = st.number_input(
+            "End position (range for mixed)", 1, 52, 52, key="mn_manual_mixed_end"
+        )
+
+    if mixed_start > mixed_end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("🎲 New mixed question", key="mn_manual_mixed_new"):
+        next_question(engine, mixed_start, mixed_end, ss.mn_manual_pick)
+        ss["mn_manual_mixed_answer_input"] = ""
+
+    question = engine.question
+
+    if question is None:
+        st.info("Click **New mixed question** to start.")
+        return
+
+    # NUMBER → CARD branch
+    if question.direction == NUM_TO_CARD:
+        st.markdown(f"### Mixed drill – Position: `{question.position}`")
+        st.caption(f"(Range: {mixed_start}–{mixed_end}, expecting a **card**)")
+        st.info("Think of the card at this position, then type it below.")
+
+        with st.expander("Reveal card"):
+            st.markdown(render_card(question.card), unsafe_allow_html=True)
+
+        ans = st.text_input(
+            "Your answer (e.g. AS, 4C, QH)",
+            key="mn_manual_mixed_answer_input",
+        )
+
+    # CARD → NUMBER branch
+    else:
+        st.markdown("### Mixed drill – Card:")
+        st.markdown(render_card(question.card), unsafe_allow_html=True)
+        st.caption(f"(Range: {mixed_start}–{mixed_end}, expecting a **position**)")
+        st.info("Think of the position of this card in Mnemonica, then type it below.")
+
+        with st.expander("Reveal position"):
+            st.markdown(f"**Position:** `{question.position}`")
+
+        ans = st.text_input(
+            "Your answer (position 1–52)",
+            key="mn_manual_mixed_answer_input",
+        )
+
+    timing = _manual_timing(question, "mn_manual_mixed_check")
+    if st.button("Check mixed answer", key="mn_manual_mixed_check") or timing:
+        _manual_check(ss, engine, question, ans, timing)
+
+    # Mixed stats
+    _manual_stats(engine, "Mixed attempts", "Mixed accuracy")
@@ -0,0 +1,109 @@
+# mnemonica/rapid.py
+import streamlit as st
+
+from auto_player import new_batch_id
+from cards import card_label
+from engine import DRILL_MODES, NUM_TO_CARD, Question
+from helpers import card_stylesheet, render_card
+from mnemonica.due import make_batch, pick_selector, record_answer
+from mnemonica.history import log_attempt
+from mnemonica.state import RapidState
+from profiling import profiled
+from rapid_fire import rapid_fire
+
+RAPID_MODES = {"Number → Card": "num", "Card → Number": "card", "Mixed": "mixed"}
+
+
+def _rapid_payload(questions: list[Question]) -> list[list]:
+    payload = []
+    for question in questions:
+        if question.direction == NUM_TO_CARD:
+            payload.append([f"<b>{question.position}</b>", question.card, "card",
+                            card_label(question.card)])
+        else:
+            payload.append([render_card(question.card), str(question.position), "pos",
+                            str(question.position)])
+    return payload
+
+
+@profiled
+def _rapid_results(rapid: RapidState, questions: list[Question], result: dict):
+    """
+    Regrade the uploaded answers with the server's parser and record them
+    like typed manual answers; the browser's grading only drives the UI.
+    Each question carries the picker the batch was drawn with.
+    """
+    engine = rapid.engine
+    right = 0
+    for question, (answer, latency_ms) in zip(questions, result["results"]):
+        ok = engine.grade(answer, question)
+        engine.record(ok, latency_ms)
+        record_answer(engine, question, ok)
+        log_attempt(engine, question, "rapid", answer, ok, latency_ms)
+        right += ok
+    rapid.last = (len(result["results"]), right, result["ms"])
+    rapid.batch = None
+
+
+# ===================== RAPID FIRE =====================
+@profiled
+def render_rapid():
+    ss = st.session_state
+    if "mn_rapid" not in ss:
+        ss.mn_rapid = RapidState()
+    rapid = ss.mn_rapid
+    engine = rapid.engine
+
+    st.title("⚡ Mnemonica – Rapid fire")
+    card_stylesheet()
+    st.markdown(
+        "Type each answer as fast as you can: right answers move on as soon as they are "
+        "complete, wrong ones show the answer for a moment. Results are sent when the batch ends."
+    )
+
+    mode = st.radio("Drill type", list(RAPID_MODES), horizontal=True, key="mn_rapid_mode")
+    pick_selector("mn_rapid_pick")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        start = st.number_input("Start position", 1, 52, 1, key="mn_rapid_start")
+    with col2:
+        end = st.number_input("End position", 1, 52, 52, key="mn_rapid_end")
+    with col3:
+        size = st.number_input("Questions per batch", 1, 200, 20, key="mn_rapid_batch_size")
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("⚡ Start batch", key="mn_rapid_start_btn"):
+        engine.mode = DRILL_MODES[RAPID_MODES[mode]]
+        questions = make_batch(engine, start, end, size, ss.mn_rapid_pick)
+        rapid.batch = (new_batch_id(), questions, _rapid_payload(questions))
+        rapid.last = None
+
+    if rapid.batch is not None:
+        batch_id, questions, payload = rapid.batch
+        result = rapid_fire(payload, batch_id, key="mn_rapid_player")
+        if result and result["id"] == batch_id:
+            _rapid_results(rapid, questions, result)
+
+    if rapid.last is not None:
+        answered, right, ms = rapid.last
+        per_minute = answered / (ms / 60_000) if ms else 0
+        st.success(
+            f"Batch done: {right}/{answered} right in {ms / 1000:.0f} s "
+            f"({per_minute:.0f} answers a minute)."
+        )
+
+    st.markdown("---")
+    col_s1, col_s2, col_s3 = st.columns(3)
+    with col_s1:
+        st.metric("Answers", engine.attempts)
+    with col_s2:
+        if engine.attempts:
+            st.metric("Accuracy", f"{engine.correct}/{engine.attempts}",
+                      f"{engine.accuracy() * 100:.0f}%")
+        else:
+            st.metric("Accuracy", "–", "+0%")
+    with col_s3:
+        mean = engine.mean_latency()
+        st.metric("Avg response", "–" if mean is None else f"{mean / 1000:.2f} s")
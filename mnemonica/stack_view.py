@@ -0,0 +1,69 @@
+# mnemonica/stack_view.py
+import streamlit as st
+
+from helpers import inject_css, render_card
+from profiling import profiled
+from stacks import get_stack
+
+STACK_LAYOUTS = {"List": 1, "4 × 13": 4}
+
+STACK_TABLE_CSS = """
+.stack-table {
+  border-collapse: collapse;
+  margin: 0.5rem 0;
+}
+.stack-table td {
+  border: none;
+  padding: 0.1rem 0.6rem;
+  font-size: 1.6rem;
+  font-weight: 700;
+  line-height: 1.2;
+}
+.stack-table td:nth-child(odd) {
+  color: #777;
+  font-family: monospace;
+  font-size: 1rem;
+  font-weight: 400;
+  text-align: right;
+}
+.stack-table td i {
+  display: block;
+  height: 44px;
+}
+"""
+
+
+@st.cache_resource
+def _stack_table_html(stack_name: str, columns: int) -> str:
+    """
+    The whole stack as one table, positions running down each column.
+    Built once per (stack, layout) and shared by every session.
+    """
+    stack = get_stack(stack_name)
+    rows = -(-len(stack) // columns)
+    body = []
+    for row in range(rows):
+        cells = []
+        for col in range(columns):
+            position = col * rows + row + 1
+            if position > len(stack):
+                break
+            cells.append(
+                f"<td>{position}</td><td>{render_card(stack.card_at(position))}</td>"
+            )
+        body.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<table class='stack-table'>{''.join(body)}</table>"
+
+
+@profiled
+def stack_view(stack_name: str = "Mnemonica"):
+    with st.expander(f"📜 Show full {stack_name} stack"):
+        inject_css("stack-table", STACK_TABLE_CSS)
+        layout = st.radio(
+            "Layout", list(STACK_LAYOUTS), horizontal=True, key="mn_stack_layout"
+        )
+        st.write("Top of deck = position 1")
+        st.markdown(
+            _stack_table_html(stack_name, STACK_LAYOUTS[layout]),
+            unsafe_allow_html=True,
+        )
@@ -0,0 +1,66 @@
+# mnemonica/state.py
+"""
+Per-page session state for the Mnemonica pages: one small object per page
+(session_state keys mn_manual, mn_auto, mn_flash, mn_rapid) instead of a loose key
+for every counter and flag. Widget values keep their own keys.
+"""
+from engine import DRILL_MODES, NUM_TO_CARD, DrillEngine
+from timers import AutoCycle
+
+DRILLS = tuple(DRILL_MODES)
+
+
+class ManualState:
+    """One engine per manual drill type; attempts live on the engines."""
+
+    __slots__ = DRILLS
+
+    def __init__(self):
+        for drill in DRILLS:
+            setattr(self, drill, DrillEngine(DRILL_MODES[drill]))
+
+
+class AutoDrill:
+    """
+    One auto drill. The thinking time is `cycle.think_seconds`; `batch` is
+    (batch id, questions, payload) while a browser batch is playing.
+    """
+
+    __slots__ = ("engine", "cycle", "running", "rounds", "batch")
+
+    def __init__(self, mode: str, think_seconds: int = 5):
+        self.engine = DrillEngine(mode)
+        self.cycle = AutoCycle(think_seconds)
+        self.running = False
+        self.rounds = 0
+        self.batch = None
+
+
+class AutoState:
+    __slots__ = DRILLS
+
+    def __init__(self):
+        for drill in DRILLS:
+            setattr(self, drill, AutoDrill(DRILL_MODES[drill]))
+
+
+class FlashState:
+    __slots__ = ("engine", "counter")
+
+    def __init__(self):
+        self.engine = DrillEngine(NUM_TO_CARD)
+        self.counter = 0
+
+
+class RapidState:
+    """
+    `batch` is (batch id, questions, payload) while a rapid-fire batch is playing;
+    `last` is the summary of the batch that came back last.
+    """
+
+    __slots__ = ("engine", "batch", "last")
+
+    def __init__(self):
+        self.engine = DrillEngine(NUM_TO_CARD)
+        self.batch = None
+        self.last = None
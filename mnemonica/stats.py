@@ -0,0 +1,147 @@
+# mnemonica/stats.py
+import math
+
+import numpy as np
+import streamlit as st
+
+from analytics import AttemptHistory
+from cards import ALL_CARDS, SUIT_SYMBOLS
+from engine import CARD_TO_NUM, NUM_TO_CARD
+from helpers import inject_css
+from mnemonica.history import attempt_store, user_id
+from mnemonica.stack_view import STACK_TABLE_CSS
+from profiling import profiled
+from stacks import get_stack
+
+STATS_DIRECTIONS = {"Both": None, "Number → Card": NUM_TO_CARD, "Card → Number": CARD_TO_NUM}
+HEATMAP_METRICS = ["Accuracy", "Median response"]
+HEATMAP_COLUMNS = 4
+TREND_DAYS = 30
+WEAKEST = 5
+
+HEATMAP_CSS = """
+.stack-table td.heat {
+  font-size: 1.2rem;
+  border-radius: 4px;
+  text-align: center;
+}
+.stack-table td.heat.red {
+  color: red;
+}
+.stack-table td.heat small {
+  display: block;
+  font-size: 0.7rem;
+  font-weight: 400;
+  color: #333;
+}
+"""
+
+
+@st.cache_resource(max_entries=256)
+def _history(user: str, stack_name: str) -> AttemptHistory:
+    """One columnar history per (user, stack), shared by that user's sessions."""
+    return AttemptHistory(user, stack_name)
+
+
+def _fmt_seconds(ms: float) -> str:
+    return "–" if math.isnan(ms) else f"{ms / 1000:.1f} s"
+
+
+def _heat_colors(values: np.ndarray, low_is_good: bool) -> list[str]:
+    """Red → green background per value, grey where there is no data."""
+    finite = values[~np.isnan(values)]
+    if low_is_good and finite.size:
+        span = finite.max() - finite.min() or 1.0
+        scores = 1 - (values - finite.min()) / span
+    else:
+        scores = values
+    return [
+        "#eee" if math.isnan(score) else f"hsl({120 * score:.0f},70%,80%)"
+        for score in scores.tolist()
+    ]
+
+
+def _heatmap_html(stack, values: np.ndarray, labels: list[str], low_is_good: bool) -> str:
+    """Same arrangement as the stack view's 4 × 13 table: positions run down each column."""
+    colors = _heat_colors(values, low_is_good)
+    rows = -(-len(stack) // HEATMAP_COLUMNS)
+    body = []
+    for row in range(rows):
+        cells = []
+        for col in range(HEATMAP_COLUMNS):
+            index = col * rows + row
+            if index >= len(stack):
+                break
+            card = stack.card_at(index + 1)
+            red = " red" if card[-1] in "HD" else ""
+            cells.append(
+                f"<td>{index + 1}</td><td class='heat{red}' style='background:{colors[index]}'>"
+                f"{card[:-1]}{SUIT_SYMBOLS[card[-1]]}<small>{labels[index]}</small></td>"
+            )
+        body.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<table class='stack-table'>{''.join(body)}</table>"
+
+
+@profiled
+def render_stats(stack_name: str = "Mnemonica"):
+    st.title("📊 Mnemonica – Analytics")
+
+    store = attempt_store()
+    store.flush()  # include attempts still queued for the writer thread
+    history = _history(user_id(), stack_name)
+    history.refresh(store)
+
+    direction_label = st.radio(
+        "Direction", list(STATS_DIRECTIONS), horizontal=True, key="mn_stats_direction"
+    )
+    stack = get_stack(stack_name)
+    summary = history.summary(stack, STATS_DIRECTIONS[direction_label])
+
+    if not summary.total_graded:
+        st.info("No graded attempts yet. Answer a few manual drills or flashcards first.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Graded attempts", summary.total_graded)
+    col2.metric("Accuracy", f"{summary.overall_accuracy() * 100:.0f}%")
+    col3.metric("Median response", _fmt_seconds(summary.latency_overall[0]))
+    col4.metric("90th percentile", _fmt_seconds(summary.latency_overall[1]))
+
+    st.subheader("By position")
+    metric = st.radio("Heatmap", HEATMAP_METRICS, horizontal=True, key="mn_stats_metric")
+    if metric == "Accuracy":
+        values = summary.accuracy
+        labels = [
+            "–" if n == 0 else f"{c}/{n}"
+            for c, n in zip(summary.correct.tolist(), summary.graded.tolist())
+        ]
+    else:
+        values = summary.latency_p50
+        labels = [_fmt_seconds(ms) for ms in values.tolist()]
+    inject_css("stack-table", STACK_TABLE_CSS)
+    inject_css("heatmap", HEATMAP_CSS)
+    st.markdown(
+        _heatmap_html(stack, values, labels, low_is_good=metric != "Accuracy"),
+        unsafe_allow_html=True,
+    )
+
+    st.subheader("Weakest cards")
+    by_card = summary.by_card
+    seen = np.flatnonzero(~np.isnan(by_card))
+    weakest = seen[np.argsort(by_card[seen], kind="stable")][:WEAKEST]
+    st.markdown("\n".join(
+        f"- {ALL_CARDS[code][:-1]}{SUIT_SYMBOLS[ALL_CARDS[code][-1]]} "
+        f"(position {stack.position_of(ALL_CARDS[code])}): {by_card[code] * 100:.0f}%"
+        for code in weakest.tolist()
+    ))
+
+    st.subheader(f"Last {TREND_DAYS} days")
+    recent = summary.days >= summary.days[-1] - TREND_DAYS + 1
+    st.line_chart(
+        {
+            "day": summary.days[recent].astype("datetime64[D]").astype(str).tolist(),
+            "Accuracy %": (summary.day_accuracy[recent] * 100).round(1).tolist(),
+        },
+        x="day",
+        y=["Accuracy %"],
+    )
@@ -0,0 +1,247 @@
+# profiling.py
+"""
+Opt-in per-rerun profiling.
+
+Enabled only from the server environment: CARD_DRILLS_PROFILE=1, or
+CARD_DRILLS_PROFILE=cprofile to also take a cProfile sample of every rerun.
+Visitors cannot switch it on. When enabled, each rerun records:
+
+- wall time of the whole rerun and of every function decorated with
+  @profiled (inclusive, summed over calls)
+- elements and bytes sent to the browser
+- optionally the top functions of a cProfile run, for every rerun or a
+  random CARD_DRILLS_PROFILE_SAMPLE fraction of them
+
+The last CARD_DRILLS_PROFILE_KEEP records of a session are shown by
+`profile_panel()`, and every record is appended as one JSON line to a
+rotating log (CARD_DRILLS_PROFILE_LOG, default profile.jsonl).
+When disabled, @profiled costs one thread-local lookup per call, and
+Streamlit is only imported once a rerun is actually profiled.
+"""
+import contextlib
+import functools
+import io
+import json
+import logging
+import logging.handlers
+import os
+import random
+import statistics
+import threading
+import time
+from collections import deque
+
+ENV_ENABLED = os.environ.get("CARD_DRILLS_PROFILE", "").lower()
+SAMPLE_RATE = float(os.environ.get("CARD_DRILLS_PROFILE_SAMPLE", "0") or 0)
+KEEP = int(os.environ.get("CARD_DRILLS_PROFILE_KEEP", "50"))
+LOG_PATH = os.environ.get(
+    "CARD_DRILLS_PROFILE_LOG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "profile.jsonl"),
+)
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 3
+TOP_FUNCTIONS = 15
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_logger = None
+
+
+class RerunRecord:
+    __slots__ = ("label", "started", "ms", "elements", "bytes", "calls", "cprofile")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.time()
+        self.ms = 0.0
+        self.elements = 0
+        self.bytes = 0
+        self.calls = {}
+        self.cprofile = None
+
+    def add_call(self, name: str, ns: int):
+        count, total = self.calls.get(name, (0, 0))
+        self.calls[name] = (count + 1, total + ns)
+
+    def to_dict(self) -> dict:
+        return {
+            "ts": self.started,
+            "label": self.label,
+            "ms": round(self.ms, 3),
+            "elements": self.elements,
+            "bytes": self.bytes,
+            "calls": {
+                name: {"n": count, "ms": round(total / 1e6, 3)}
+                for name, (count, total) in self.calls.items()
+            },
+            "cprofile": self.cprofile,
+        }
+
+
+# ===================== SWITCHES =====================
+def _mode() -> str:
+    """'' (off), 'on' or 'cprofile', from the server environment only."""
+    if ENV_ENABLED == "cprofile":
+        return "cprofile"
+    return "on" if ENV_ENABLED in ("1", "true", "yes", "on") else ""
+
+
+def _log() -> logging.Logger:
+    global _logger
+    with _log_lock:
+        if _logger is None:
+            logger = logging.getLogger("card_drills.profile")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            handler = logging.handlers.RotatingFileHandler(
+                LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            _logger = logger
+    return _logger
+
+
+# ===================== RECORDING =====================
+def profiled(func):
+    """Time every call of `func` into the current rerun's record, if any."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        record = getattr(_local, "record", None)
+        if record is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record.add_call(name, time.perf_counter_ns() - started)
+
+    return wrapper
+
+
+def _count_messages(ctx, record: RerunRecord):
+    """Wrap the script context's enqueue to count what this rerun sends."""
+    enqueue = ctx._enqueue
+
+    def counting(msg):
+        record.bytes += msg.ByteSize()
+        if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            record.elements += 1
+        enqueue(msg)
+
+    ctx._enqueue = counting
+    return enqueue
+
+
+def _top_functions(profiler) -> list[str]:
+    import pstats
+
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+    lines = out.getvalue().splitlines()
+    start = next((i for i, line in enumerate(lines) if line.lstrip().startswith("ncalls")), 0)
+    return [line for line in lines[start:] if line.strip()]
+
+
+@contextlib.contextmanager
+def rerun_profile(label: str):
+    """
+    Profile one rerun (or fragment rerun) of the script. Does nothing when
+    profiling is off, and only times the block when a rerun is already being
+    profiled (e.g. a fragment running inside a full rerun).
+    """
+    if getattr(_local, "record", None) is not None:
+        with _timed(label):
+            yield
+        return
+    mode = _mode()
+    if not mode:
+        yield
+        return
+
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    record = RerunRecord(label)
+    ctx = get_script_run_ctx()
+    original = _count_messages(ctx, record) if ctx is not None else None
+    profiler = None
+    if mode == "cprofile" or (SAMPLE_RATE and random.random() < SAMPLE_RATE):
+        import cProfile
+
+        profiler = cProfile.Profile()
+    _local.record = record
+    started = time.perf_counter_ns()
+    try:
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler is already active
+                profiler = None
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        record.ms = (time.perf_counter_ns() - started) / 1e6
+        _local.record = None
+        if original is not None:
+            ctx._enqueue = original
+        if profiler is not None:
+            record.cprofile = _top_functions(profiler)
+        _finish(record, ctx)
+
+
+@contextlib.contextmanager
+def _timed(name: str):
+    record = _local.record
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        record.add_call(name, time.perf_counter_ns() - started)
+
+
+def _finish(record: RerunRecord, ctx):
+    import streamlit as st
+
+    data = record.to_dict()
+    reruns = st.session_state.get("_profile_reruns")
+    if reruns is None:
+        reruns = st.session_state["_profile_reruns"] = deque(maxlen=KEEP)
+    reruns.append(data)
+    data = dict(data, session=ctx.session_id if ctx is not None else None)
+    _log().info(json.dumps(data, separators=(",", ":")))
+
+
+# ===================== PANEL =====================
+def profile_panel():
+    """Collapsible sidebar table of this session's last reruns."""
+    if not _mode():
+        return
+    import streamlit as st
+
+    reruns = st.session_state.get("_profile_reruns")
+    if not reruns:
+        return
+    with st.sidebar.expander(f"⏱ Profile (last {len(reruns)} reruns)"):
+        times = [r["ms"] for r in reruns]
+        st.caption(
+            f"median {statistics.median(times):.1f} ms · max {max(times):.1f} ms · "
+            f"log: {os.path.basename(LOG_PATH)}"
+        )
+        rows = ["| rerun | ms | elements | KB |", "|---|---:|---:|---:|"]
+        for r in list(reruns)[-10:][::-1]:
+            rows.append(f"| {r['label']} | {r['ms']:.1f} | {r['elements']} | {r['bytes'] / 1024:.1f} |")
+        st.markdown("\n".join(rows))
+
+        last = reruns[-1]
+        st.markdown(f"**Last rerun: {last['label']}**")
+        calls = sorted(last["calls"].items(), key=lambda item: -item[1]["ms"])
+        st.markdown("\n".join(
+            ["| function | calls | ms |", "|---|---:|---:|"]
+            + [f"| `{name}` | {c['n']} | {c['ms']:.2f} |" for name, c in calls]
+        ))
+        if last["cprofile"]:
+            st.code("\n".join(last["cprofile"]), language=None)
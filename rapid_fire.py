@@ -0,0 +1,38 @@
+# rapid_fire.py
+import os
+
+import streamlit.components.v1 as components
+
+from card_art import STYLESHEET_URL
+from cards import RANK_ALIASES, SUIT_ALIASES
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "rapid_fire")
+_component = components.declare_component("rapid_fire", path=_FRONTEND)
+
+# The answer map the browser grades with: the same spellings cards.py accepts.
+_ALIASES = {
+    "ranks": {rank: list(names) for rank, names in RANK_ALIASES.items()},
+    "suits": {suit: list(names) for suit, names in SUIT_ALIASES.items()},
+}
+
+
+def rapid_fire(questions: list[list], batch_id: str, size: int = 52,
+               key: str | None = None):
+    """
+    Play a batch of typed questions in the browser, graded as you type.
+
+    Each question is `[question_html, expected, kind, reveal_html]`, where
+    `kind` is "card" (expected is a card code) or "pos" (a position as
+    text). Right answers advance at once, wrong ones show the reveal
+    briefly. The component returns `{"id", "results", "ms"}` once, with one
+    `[answer, ms]` per answered question, and None until then.
+    """
+    return _component(
+        questions=questions,
+        batch_id=batch_id,
+        aliases=_ALIASES,
+        size=size,
+        stylesheet=STYLESHEET_URL,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,64 @@
+# sampler.py
+import random
+
+
+class ShuffleBag:
+    """
+    Positions start..end (1-based, inclusive) drawn without replacement.
+
+    Each pass is a fresh shuffle of the range, so every position comes up
+    exactly once per (end - start + 1) draws, and a pass never opens with the
+    position that closed the previous one. With `mixed`, every draw also gets
+    a direction bit (0 / 1); each pass holds as many of one as of the other,
+    and for odd ranges the extra one alternates between passes.
+
+    The state is two short byte strings and a cursor, small enough to keep
+    one bag per drill in session state.
+    """
+
+    __slots__ = ("start", "end", "mixed", "rng", "_order", "_flips", "_next", "_spare")
+
+    def __init__(self, start: int, end: int, mixed: bool = False,
+                 rng: random.Random | None = None):
+        if not 1 <= start <= end <= 255:
+            raise ValueError("Start position must be ≤ end position.")
+        self.start = start
+        self.end = end
+        self.mixed = mixed
+        self.rng = rng or random
+        self._order = b""
+        self._flips = b""
+        self._next = 0
+        self._spare = self.rng.randrange(2)
+
+    def __len__(self) -> int:
+        return self.end - self.start + 1
+
+    def covers(self, start: int, end: int, mixed: bool) -> bool:
+        return (start, end, mixed) == (self.start, self.end, self.mixed)
+
+    def _refill(self):
+        rng = self.rng
+        order = list(range(self.start, self.end + 1))
+        rng.shuffle(order)
+        if len(order) > 1 and self._order and order[0] == self._order[-1]:
+            swap = rng.randrange(1, len(order))
+            order[0], order[swap] = order[swap], order[0]
+        self._order = bytes(order)
+        if self.mixed:
+            half = len(order) // 2
+            flips = [0, 1] * half
+            if len(order) % 2:
+                flips.append(self._spare)
+                self._spare ^= 1
+            rng.shuffle(flips)
+            self._flips = bytes(flips)
+        self._next = 0
+
+    def draw(self) -> tuple[int, int]:
+        """Next (position, direction bit); the bit is always 0 unless `mixed`."""
+        if self._next >= len(self._order):
+            self._refill()
+        i = self._next
+        self._next = i + 1
+        return self._order[i], self._flips[i] if self.mixed else 0
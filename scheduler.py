@@ -0,0 +1,135 @@
+# scheduler.py
+import heapq
+import itertools
+import random
+import time
+
+# Leitner boxes: a correct answer moves an item up one box, a miss sends it
+# back to box 0. Each box has its own review interval (seconds).
+LEITNER_INTERVALS = (15, 60, 5 * 60, 30 * 60, 2 * 3600, 24 * 3600, 7 * 24 * 3600)
+
+
+def review_key(stack_name: str, direction: str, card: str) -> tuple:
+    """The one key format for scheduled items; DrillEngine.review_key builds it here."""
+    return (stack_name, direction, card)
+
+
+class ReviewItem:
+    __slots__ = ("box", "due", "seq", "reviews", "lapses")
+
+    def __init__(self, due: float, seq: int):
+        self.box = 0
+        self.due = due
+        self.seq = seq
+        self.reviews = 0
+        self.lapses = 0
+
+
+class Scheduler:
+    """
+    Spaced-repetition queue of (stack, direction, card) items.
+
+    Items live in one heap per (stack, direction), ordered by due time.
+    Rescheduling pushes a fresh entry and leaves the old one behind; stale
+    entries are recognised by their sequence number and dropped when they
+    reach the top. Picking and grading are therefore O(log n).
+    """
+
+    def __init__(self, intervals=LEITNER_INTERVALS):
+        self.intervals = intervals
+        self._items = {}
+        self._heaps = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def _push(self, key, item: ReviewItem):
+        item.seq = next(self._seq)
+        heapq.heappush(self._heaps.setdefault(key[:2], []), (item.due, item.seq, key))
+
+    def add(self, key, due: float = 0.0):
+        """Add a new item; new items are due immediately by default."""
+        if key in self._items:
+            return
+        item = self._items[key] = ReviewItem(due, 0)
+        self._push(key, item)
+
+    def ensure(self, stack_name: str, direction: str, cards, rng: random.Random | None = None):
+        """Add any of `cards` not scheduled yet, in random order."""
+        missing = [c for c in cards if review_key(stack_name, direction, c) not in self._items]
+        (rng or random).shuffle(missing)
+        for card in missing:
+            self.add(review_key(stack_name, direction, card))
+
+    def peek(self, stack_name: str, direction: str, accept=None):
+        """
+        Earliest-due item of a stack/direction as (key, due), or None.
+        `accept(card)` restricts the choice (e.g. to a position range);
+        entries it rejects are put back afterwards.
+        """
+        heap = self._heaps.get((stack_name, direction))
+        if not heap:
+            return None
+        skipped = []
+        found = None
+        while heap:
+            due, seq, key = heap[0]
+            if self._items[key].seq != seq:
+                heapq.heappop(heap)
+                continue
+            if accept is None or accept(key[2]):
+                found = (key, due)
+                break
+            skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def _item(self, key) -> ReviewItem:
+        """The item for `key`, added first if the scheduler never issued it."""
+        item = self._items.get(key)
+        if item is None:
+            self.add(key)
+            item = self._items[key]
+        return item
+
+    def _apply(self, item: ReviewItem, correct: bool, now: float):
+        item.reviews += 1
+        if correct:
+            item.box = min(item.box + 1, len(self.intervals) - 1)
+        else:
+            item.box = 0
+            item.lapses += 1
+        item.due = now + self.intervals[item.box]
+
+    def grade(self, key, correct: bool, now: float | None = None):
+        now = time.time() if now is None else now
+        item = self._item(key)
+        self._apply(item, correct, now)
+        self._push(key, item)
+
+    def replay(self, answers):
+        """
+        Grade logged answers, (key, correct, answered_at) oldest first, as if
+        each had been given at its time. Every item is pushed once at the end.
+        """
+        graded = {}
+        for key, correct, answered_at in answers:
+            item = graded.get(key)
+            if item is None:
+                item = graded[key] = self._items.get(key) or ReviewItem(0.0, 0)
+                self._items[key] = item
+            self._apply(item, correct, answered_at)
+        for key, item in graded.items():
+            self._push(key, item)
+
+    def touch(self, key, now: float | None = None):
+        """Push an item back by its current interval without grading it."""
+        now = time.time() if now is None else now
+        item = self._item(key)
+        item.due = now + self.intervals[item.box]
+        self._push(key, item)
@@ -0,0 +1,44 @@
+# serve.py
+"""
+ASGI entry point: the same app as `streamlit run card_drills.py`, plus
+long-lived cache headers for the card sprite and its stylesheet.
+
+Streamlit serves static/ without a Cache-Control header, so browsers keep
+revalidating both files. Their names change with their content
+(card_art.ASSET_HASH), which makes them safe to cache for a year.
+
+    streamlit run serve.py
+    uvicorn serve:app --port 8501
+"""
+import streamlit as st
+from starlette.middleware import Middleware
+
+from card_art import SPRITE_NAME, STATIC_URL, STYLESHEET_NAME, missing_assets
+
+IMMUTABLE = b"public, max-age=31536000, immutable"
+CACHED_PATHS = tuple(f"/{STATIC_URL}/{name}" for name in (SPRITE_NAME, STYLESHEET_NAME))
+
+
+class SpriteCacheHeaders:
+    """Mark successful responses for the current card assets as immutable."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].endswith(CACHED_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_cached(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [(k, v) for k, v in message["headers"] if k.lower() != b"cache-control"]
+                message = dict(message, headers=headers + [(b"cache-control", IMMUTABLE)])
+            await send(message)
+
+        await self.app(scope, receive, send_cached)
+
+
+if missing_assets():
+    raise RuntimeError(f"static/ lacks {', '.join(missing_assets())}: run python -m card_art")
+app = st.App("card_drills.py", middleware=[Middleware(SpriteCacheHeaders)])
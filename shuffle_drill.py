@@ -0,0 +1,123 @@
+# shuffle_drill.py
+import streamlit as st
+
+from cards import card_label, parse_card
+from engine import CARD_TO_NUM, MIXED, NUM_TO_CARD, DrillEngine, parse_position
+from helpers import card_stylesheet, render_card
+from profiling import profiled
+from shuffles import describe, order_period, parse_sequence, transformed
+from stacks import STACKS
+
+SHUFFLE_MODES = {
+    "Number → Card": NUM_TO_CARD,
+    "Card → Number": CARD_TO_NUM,
+    "Mixed": MIXED,
+}
+DEFAULT_SEQUENCE = "cut 26, 2 out"
+
+
+@profiled
+def _shuffle_query(stack):
+    """Instant look-up in the shuffled deck: a position gives the card, a card its position."""
+    query = st.text_input("Look up a position or a card", key="sh_query",
+                          placeholder="e.g. 17 or 7D")
+    if not query:
+        return
+    position = parse_position(query)
+    card = parse_card(query)
+    if position is not None and 1 <= position <= len(stack):
+        st.markdown(f"Position `{position}` holds **{card_label(stack.card_at(position))}**.")
+    elif card is not None:
+        st.markdown(f"**{card_label(card)}** is at position `{stack.position_of(card)}`.")
+    else:
+        st.warning(f"“{query}” is neither a position nor a card.")
+
+
+@profiled
+def render_shuffle():
+    ss = st.session_state
+    if "sh_drill" not in ss:
+        ss.sh_drill = DrillEngine()
+    engine = ss.sh_drill
+
+    st.title("🌀 After the shuffle")
+    card_stylesheet()
+    st.markdown(
+        "Apply cuts, faros, deals and reversals to a stack, then drill the deck **as it is now**. "
+        "Steps are separated by commas: `cut 10`, `3 out` (out-faros), `in`, `deal 5` "
+        "(deal 5 into a pile and replace it), `reverse`."
+    )
+
+    names = STACKS.names()
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        stack_name = st.selectbox("Stack", names, key="sh_stack")
+    with col2:
+        text = st.text_input("Shuffle sequence", DEFAULT_SEQUENCE, key="sh_sequence")
+    try:
+        steps = parse_sequence(text)
+        stack = transformed(stack_name, steps)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    st.caption(
+        f"{stack_name} after **{describe(steps)}** · repeating it "
+        f"{order_period(steps, len(stack))} times restores the deck"
+    )
+    if engine.stack is not stack:
+        engine.stack = stack
+        engine.bag = None
+        engine.question = None
+
+    _shuffle_query(stack)
+    st.divider()
+
+    mode = st.radio("Drill type", list(SHUFFLE_MODES), horizontal=True, key="sh_mode")
+    engine.mode = SHUFFLE_MODES[mode]
+    col3, col4 = st.columns(2)
+    with col3:
+        start = st.number_input("Start position", 1, 52, 1, key="sh_start")
+    with col4:
+        end = st.number_input("End position", 1, 52, 52, key="sh_end")
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("🎲 New question", key="sh_new"):
+        engine.new_question(start, end)
+        ss["sh_answer_input"] = ""
+
+    question = engine.question
+    if question is None:
+        return
+    if question.direction == NUM_TO_CARD:
+        st.markdown(f"### Position after the shuffle: `{question.position}`")
+        label = "The card (e.g. AS, 4C, QH)"
+        reveal = render_card(question.card)
+    else:
+        st.markdown("### Where is this card after the shuffle?")
+        st.markdown(render_card(question.card), unsafe_allow_html=True)
+        label = "Its position"
+        reveal = f"**Position:** `{question.position}`"
+    with st.expander("Reveal"):
+        st.markdown(reveal, unsafe_allow_html=True)
+
+    answer = st.text_input(label, key="sh_answer_input")
+    if st.button("Check answer", key="sh_check"):
+        if engine.check(answer):
+            st.success("✅ Correct!")
+        elif question.direction == NUM_TO_CARD:
+            st.error(f"❌ Incorrect. It is **{card_label(question.card)}**.")
+        else:
+            st.error(f"❌ Incorrect. It is at position `{question.position}`.")
+
+    st.markdown("---")
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        st.metric("Attempts", engine.attempts)
+    with col_s2:
+        if engine.attempts:
+            st.metric("Accuracy", f"{engine.correct}/{engine.attempts}",
+                      f"{engine.accuracy() * 100:.0f}%")
+        else:
+            st.metric("Accuracy", "–", "+0%")
@@ -0,0 +1,163 @@
+# shuffles.py
+"""
+Where the cards go after cuts, faros, deals and reversals.
+
+Every operation is a permutation array `p` over 0-based positions: after
+the operation, position i holds the card that was at position p[i], so a
+deck transforms as `order[p]` and "a then b" is the single array `a[b]`.
+Repeats ("3 out-faros") are computed by exponentiation by squaring, and
+operation powers, parsed sequences and transformed stacks are all memoised
+for the process.
+
+A sequence is written as comma-separated steps, each an operation with an
+optional argument and repeat count:
+
+    cut 10, 3 × out, reverse, deal 5, in × 2
+"""
+import functools
+import re
+
+import numpy as np
+
+from cards import ALL_CARDS
+from stacks import Stack, get_stack
+
+DECK_SIZE = 52
+
+
+# ===================== OPERATIONS =====================
+def _cut(n: int, k: int) -> np.ndarray:
+    """Cut k cards from the top to the bottom."""
+    return (np.arange(n) + k) % n
+
+
+def _faro(n: int, out: bool) -> np.ndarray:
+    """Perfect riffle of two equal halves; an out-faro keeps the top card on top."""
+    if n % 2:
+        raise ValueError("A perfect faro needs an even number of cards.")
+    half = np.arange(n // 2)
+    perm = np.empty(n, dtype=np.intp)
+    perm[0::2], perm[1::2] = (half, half + n // 2) if out else (half + n // 2, half)
+    return perm
+
+
+def _reverse(n: int, _k: int) -> np.ndarray:
+    """Turn the deck over (face-down order reversed)."""
+    return np.arange(n)[::-1].copy()
+
+
+def _deal(n: int, k: int) -> np.ndarray:
+    """Deal k cards one by one into a pile and put the pile back on top."""
+    perm = np.arange(n)
+    perm[:k] = perm[:k][::-1]
+    return perm
+
+
+# name → (builder(n, arg), takes an argument, aliases)
+OPERATIONS = {
+    "cut": (_cut, True, ("cut",)),
+    "out": (lambda n, _k: _faro(n, True), False, ("out", "out-faro", "outfaro", "faro", "out faro")),
+    "in": (lambda n, _k: _faro(n, False), False, ("in", "in-faro", "infaro", "in faro")),
+    "reverse": (_reverse, False, ("reverse", "rev", "turn over")),
+    "deal": (_deal, True, ("deal", "reverse count")),
+}
+_ALIASES = {alias: name for name, (_, _, aliases) in OPERATIONS.items() for alias in aliases}
+_STEP = re.compile(
+    r"^(?:(?P<pre>\d+)\s*[x×*]?\s+)?(?P<op>[a-z][a-z -]*?)(?:\s+(?P<arg>\d+))?"
+    r"(?:\s*(?:[x×*]|times)\s*(?P<post>\d+))?s?$"
+)
+
+
+def _frozen(perm: np.ndarray) -> np.ndarray:
+    perm.setflags(write=False)  # memoised arrays are shared between sessions
+    return perm
+
+
+@functools.lru_cache(maxsize=None)
+def operation(name: str, arg: int = 0, n: int = DECK_SIZE) -> np.ndarray:
+    builder, takes_arg, _ = OPERATIONS[name]
+    if takes_arg and not 0 <= arg <= n:
+        raise ValueError(f"{name} takes a number of cards between 0 and {n}.")
+    return _frozen(builder(n, arg))
+
+
+@functools.lru_cache(maxsize=1024)
+def power(name: str, arg: int, times: int, n: int = DECK_SIZE) -> np.ndarray:
+    """The operation applied `times` times, by squaring: O(log times) compositions."""
+    result = np.arange(n)
+    base = operation(name, arg, n)
+    while times:
+        if times & 1:
+            result = result[base]
+        times >>= 1
+        if times:
+            base = base[base]
+    return _frozen(result)
+
+
+# ===================== SEQUENCES =====================
+@functools.lru_cache(maxsize=1024)
+def parse_sequence(text: str) -> tuple[tuple[str, int, int], ...]:
+    """
+    "cut 10, 3 out" → (("cut", 10, 1), ("out", 0, 3)). Raises ValueError
+    naming the step it cannot read.
+    """
+    steps = []
+    for raw in re.split(r"[,;\n]+", text.lower()):
+        step = " ".join(raw.split())
+        if not step:
+            continue
+        match = _STEP.match(step)
+        name = _ALIASES.get(match["op"].strip()) if match else None
+        if name is None:
+            raise ValueError(f"Unknown step: {raw.strip()!r}")
+        takes_arg = OPERATIONS[name][1]
+        if takes_arg != (match["arg"] is not None):
+            need = "needs a" if takes_arg else "takes no"
+            raise ValueError(f"{name} {need} number of cards: {raw.strip()!r}")
+        times = int(match["pre"] or 1) * int(match["post"] or 1)
+        steps.append((name, int(match["arg"] or 0), times))
+    return tuple(steps)
+
+
+def describe(steps) -> str:
+    """Canonical text of a parsed sequence ("cut 10, out × 3")."""
+    parts = []
+    for name, arg, times in steps:
+        part = f"{name} {arg}" if OPERATIONS[name][1] else name
+        parts.append(part if times == 1 else f"{part} × {times}")
+    return ", ".join(parts) or "no shuffle"
+
+
+@functools.lru_cache(maxsize=1024)
+def compose(steps, n: int = DECK_SIZE) -> np.ndarray:
+    """One permutation for a whole parsed sequence."""
+    result = np.arange(n)
+    for name, arg, times in steps:
+        result = result[power(name, arg, times, n)]
+    return _frozen(result)
+
+
+@functools.lru_cache(maxsize=256)
+def transformed(stack_name: str, steps) -> Stack:
+    """A stack as it is after `steps`; shared by every session that asks."""
+    stack = get_stack(stack_name)
+    order = np.frombuffer(stack.order, np.uint8)[compose(steps, len(stack))]
+    return Stack(f"{stack_name} after {describe(steps)}", [ALL_CARDS[code] for code in order.tolist()])
+
+
+def order_period(steps, n: int = DECK_SIZE) -> int:
+    """How many repeats of the sequence bring the deck back to its starting order."""
+    perm = compose(steps, n)
+    seen = np.zeros(n, dtype=bool)
+    period = 1
+    for start in range(n):
+        if seen[start]:
+            continue
+        length, i = 0, start
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i]
+            length += 1
+        period = np.lcm(period, length)
+    return int(period)
@@ -1,3 +1,8 @@
+import os
+import threading
+
+from cards import ALL_CARDS, CARD_CODE
+
 MNEMONICA = [
     "4C", "2H", "7D", "3C", "4H", "6D", "AS", "5H", "9S", "2S",
     "QH", "3D", "QC", "8H", "6S", "5S", "9H", "KC", "2D", "JH",
@@ -6,4 +11,91 @@ MNEMONICA = [
     "7H", "4D", "AC", "9C", "JS", "QD", "7C", "QS", "10D", "6C",
     "AH", "9D",
 ]
-MNEMONICA_CARD_TO_POS = {card: i + 1 for i, card in enumerate(MNEMONICA)}
+
+# ===================== STACK REGISTRY =====================
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stack_data")
+
+
+class Stack:
+    """
+    A memorized deck stored as two 52-byte arrays of card codes (see cards.py):
+    `order[i]` is the code at position i + 1, `positions[code]` is its index.
+    """
+
+    __slots__ = ("name", "order", "positions")
+
+    def __init__(self, name: str, cards: list[str]):
+        codes = [CARD_CODE[card] for card in cards]
+        if sorted(codes) != list(range(52)):
+            raise ValueError(f"Stack {name!r} is not a full 52-card deck.")
+        self.name = name
+        self.order = bytes(codes)
+        inverse = bytearray(52)
+        for index, code in enumerate(codes):
+            inverse[code] = index
+        self.positions = bytes(inverse)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def card_at(self, position: int) -> str:
+        """Card at a 1-based position."""
+        return ALL_CARDS[self.order[position - 1]]
+
+    def position_of(self, card: str) -> int:
+        """1-based position of a card."""
+        return self.positions[CARD_CODE[card]] + 1
+
+    def cards(self) -> list[str]:
+        return [ALL_CARDS[code] for code in self.order]
+
+
+def _load_data_file(filename: str):
+    def load() -> list[str]:
+        with open(os.path.join(_DATA_DIR, filename), encoding="utf-8") as f:
+            return f.read().split()
+    return load
+
+
+class StackRegistry:
+    """
+    Process-wide table of stacks. Loaders are registered up front and run
+    the first time a stack is asked for; every session shares the result.
+    `version` changes with every registration, for indexes built over all
+    stacks (see translation.py).
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._stacks = {}
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def register(self, name: str, loader):
+        self._loaders[name] = loader
+        self._stacks.pop(name, None)
+        self.version += 1
+
+    def names(self) -> list[str]:
+        return list(self._loaders)
+
+    def loaded(self) -> list[str]:
+        return list(self._stacks)
+
+    def get(self, name: str) -> Stack:
+        stack = self._stacks.get(name)
+        if stack is None:
+            with self._lock:
+                stack = self._stacks.get(name)
+                if stack is None:
+                    stack = self._stacks[name] = Stack(name, self._loaders[name]())
+        return stack
+
+
+STACKS = StackRegistry()
+STACKS.register("Mnemonica", lambda: MNEMONICA)
+STACKS.register("Aronson", _load_data_file("aronson.txt"))
+
+
+def get_stack(name: str = "Mnemonica") -> Stack:
+    return STACKS.get(name)
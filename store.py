@@ -0,0 +1,161 @@
+# store.py
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id          INTEGER PRIMARY KEY,
+    user        TEXT NOT NULL,
+    stack       TEXT NOT NULL,
+    mode        TEXT NOT NULL,     -- manual / auto / flash
+    direction   TEXT NOT NULL,     -- num_to_card / card_to_num
+    position    INTEGER NOT NULL,
+    card        TEXT NOT NULL,
+    answer      TEXT,              -- NULL for reveal-only modes
+    correct     INTEGER,           -- 1 / 0, NULL for reveal-only modes
+    shown_at    REAL NOT NULL,
+    answered_at REAL NOT NULL,
+    latency_ms  INTEGER            -- measured in the browser, NULL if unknown
+);
+CREATE INDEX IF NOT EXISTS attempts_by_user ON attempts (user, answered_at);
+CREATE INDEX IF NOT EXISTS attempts_by_card ON attempts (stack, card, direction);
+CREATE INDEX IF NOT EXISTS attempts_by_user_stack ON attempts (user, stack, id);
+"""
+
+COLUMNS = (
+    "user", "stack", "mode", "direction", "position", "card",
+    "answer", "correct", "shown_at", "answered_at", "latency_ms",
+)
+
+_log = logging.getLogger(__name__)
+
+_INSERT = (
+    f"INSERT INTO attempts ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))})"
+)
+
+
+def _migrate(conn: sqlite3.Connection):
+    """Bring databases created by older versions up to SCHEMA."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(attempts)")}
+    if "latency_ms" not in existing:
+        with conn:
+            conn.execute("ALTER TABLE attempts ADD COLUMN latency_ms INTEGER")
+
+
+class AttemptStore:
+    """
+    Attempt history in SQLite (WAL mode).
+
+    `record()` only puts a row on a queue; a background thread writes rows
+    in batches, one transaction per batch, so callers never wait on disk.
+    Rows are flushed when `batch_size` are waiting, after `flush_interval`
+    seconds, on `flush()` and at interpreter exit. A batch that fails to
+    write (e.g. "database is locked") is logged and dropped; the writer
+    keeps running.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._closed = False
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        _migrate(conn)
+        conn.close()
+
+        self._writer = threading.Thread(target=self._run, name="attempt-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ---------- writing ----------
+    def record(self, user: str, stack: str, mode: str, direction: str, position: int,
+               card: str, answer: str | None, correct: bool | None,
+               shown_at: float, answered_at: float | None = None,
+               latency_ms: int | None = None):
+        answered_at = time.time() if answered_at is None else answered_at
+        self._queue.put((
+            user, stack, mode, direction, position, card, answer,
+            None if correct is None else int(correct), shown_at, answered_at,
+            latency_ms,
+        ))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until everything recorded so far has been written. False if
+        that took longer than `timeout` seconds or the writer is not running.
+        """
+        if not self._writer.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+
+    def _run(self):
+        conn = self._connect()
+        batch = []
+        waiters = []
+        stop = False
+        while not stop:
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+            try:
+                if batch:
+                    with conn:
+                        conn.executemany(_INSERT, batch)
+            except Exception:
+                _log.exception("Dropped %d attempts: the write failed", len(batch))
+            finally:
+                batch = []
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+        conn.close()
+
+    # ---------- reading ----------
+    def history(self, user: str, stack: str, after_id: int = 0) -> list[tuple]:
+        """
+        (id, direction, position, correct, latency_ms, answered_at) of a
+        user's attempts on a stack with id > `after_id`, by id. Served from
+        the (user, stack, id) index, so polling for new rows stays cheap.
+        """
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT id, direction, position, correct, latency_ms, answered_at "
+                "FROM attempts WHERE user = ? AND stack = ? AND id > ? ORDER BY id",
+                (user, stack, after_id),
+            ).fetchall()
+        finally:
+            conn.close()
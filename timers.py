@@ -0,0 +1,57 @@
+# timers.py
+import time
+
+THINK = "think"
+REVEAL = "reveal"
+
+
+def countdown_label(seconds: int, label: str) -> str:
+    return f"⏳ **{label}: {seconds}**"
+
+
+class AutoCycle:
+    """
+    Deadline-driven think → reveal cycle for one auto drill.
+
+    Nothing here sleeps: the UI polls `tick()` (e.g. from a fragment that
+    reruns every second) and the cycle moves on once its deadline has passed.
+    """
+
+    __slots__ = ("think_seconds", "reveal_seconds", "phase", "deadline")
+
+    def __init__(self, think_seconds: int, reveal_seconds: int = 3):
+        self.think_seconds = think_seconds
+        self.reveal_seconds = reveal_seconds
+        self.phase = None
+        self.deadline = 0.0
+
+    def start(self, now: float | None = None):
+        now = time.monotonic() if now is None else now
+        self.phase = THINK
+        self.deadline = now + self.think_seconds
+
+    def stop(self):
+        self.phase = None
+
+    def tick(self, now: float | None = None) -> str | None:
+        """
+        Advance past any expired deadline.
+        Returns THINK when a new question should be drawn, REVEAL when the
+        answer is due to be shown, None when nothing changed.
+        """
+        now = time.monotonic() if now is None else now
+        if self.phase is None:
+            self.start(now)
+            return THINK
+        if now < self.deadline:
+            return None
+        if self.phase == THINK:
+            self.phase = REVEAL
+            self.deadline = now + self.reveal_seconds
+            return REVEAL
+        self.start(now)
+        return THINK
+
+    def remaining(self, now: float | None = None) -> int:
+        now = time.monotonic() if now is None else now
+        return max(0, int(self.deadline - now + 0.999))
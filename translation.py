@@ -0,0 +1,101 @@
+# translation.py
+"""
+Cross-stack translation: "the card at Mnemonica 17 – where is it in Aronson?"
+
+`translation_index()` composes every registered stack with every other one
+in a single NumPy step and keeps the result for the process, so answering
+a translation question is one lookup however many stacks there are.
+"""
+import threading
+
+import numpy as np
+
+from engine import parse_position
+from sampler import ShuffleBag
+from stacks import STACKS
+
+
+class TranslationIndex:
+    """
+    `table[dst, src, i]` is the 0-based position in stack `dst` of the card
+    at 0-based position `i` of stack `src`, for every ordered pair of stacks
+    (slots follow `names`). Built as positions[:, order]: each stack's
+    position array composed with each stack's order array.
+    """
+
+    __slots__ = ("names", "version", "table", "_slot", "_flat", "_size")
+
+    def __init__(self, stacks, version: int = 0):
+        self.names = [stack.name for stack in stacks]
+        self.version = version
+        self._slot = {name: i for i, name in enumerate(self.names)}
+        count, size = len(stacks), len(stacks[0])
+        order = np.frombuffer(b"".join(s.order for s in stacks), np.uint8).reshape(count, size)
+        positions = np.frombuffer(b"".join(s.positions for s in stacks), np.uint8).reshape(count, size)
+        self.table = positions[:, order]
+        # Scalar lookups go through bytes: indexing them is cheaper than numpy.
+        self._flat = self.table.tobytes()
+        self._size = size
+
+    def position(self, src: str, dst: str, position: int) -> int:
+        """1-based position in `dst` of the card at 1-based `position` in `src`."""
+        offset = (self._slot[dst] * len(self.names) + self._slot[src]) * self._size
+        return self._flat[offset + position - 1] + 1
+
+    def pair(self, src: str, dst: str) -> np.ndarray:
+        """The whole src → dst map as 0-based positions."""
+        return self.table[self._slot[dst], self._slot[src]]
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def translation_index() -> TranslationIndex:
+    """The process-wide index, rebuilt only when the stack registry changes."""
+    global _index
+    index = _index
+    if index is None or index.version != STACKS.version:
+        with _lock:
+            if _index is None or _index.version != STACKS.version:
+                version = STACKS.version
+                _index = TranslationIndex([STACKS.get(name) for name in STACKS.names()], version)
+            index = _index
+    return index
+
+
+class TranslationDrill:
+    """
+    Headless translation drill: a position in `src` is asked, the answer is
+    the position of the same card in `dst`. Positions come from a shuffle
+    bag over start..end, like the other drills.
+    """
+
+    __slots__ = ("src", "dst", "bag", "question", "attempts", "correct")
+
+    def __init__(self, src: str = "Mnemonica", dst: str = "Aronson"):
+        self.src = src
+        self.dst = dst
+        self.bag = None
+        self.question = None
+        self.attempts = 0
+        self.correct = 0
+
+    def new_question(self, start: int = 1, end: int = 52) -> int:
+        if self.bag is None or not self.bag.covers(start, end, False):
+            self.bag = ShuffleBag(start, end)
+        self.question = self.bag.draw()[0]
+        return self.question
+
+    def answer(self, position: int | None = None) -> int:
+        """Position in `dst` for `position` in `src` (default: the current question)."""
+        return translation_index().position(self.src, self.dst, position or self.question)
+
+    def check(self, answer: str) -> bool:
+        ok = parse_position(answer) == self.answer()
+        self.attempts += 1
+        self.correct += ok
+        return ok
+
+    def accuracy(self) -> float | None:
+        return self.correct / self.attempts if self.attempts else None
@@ -0,0 +1,73 @@
+# translation_drill.py
+import streamlit as st
+
+from helpers import card_stylesheet, render_card
+from profiling import profiled
+from stacks import STACKS, get_stack
+from translation import TranslationDrill
+
+
+@profiled
+def render_translation():
+    ss = st.session_state
+    if "tr_drill" not in ss:
+        ss.tr_drill = TranslationDrill()
+    drill = ss.tr_drill
+
+    st.title("🔀 Translation drills")
+    card_stylesheet()
+    st.markdown(
+        "Take the card at a position in one stack and say **where it sits in the other**."
+    )
+
+    names = STACKS.names()
+    col1, col2 = st.columns(2)
+    with col1:
+        drill.src = st.selectbox("From stack", names, index=names.index(drill.src), key="tr_src")
+    with col2:
+        drill.dst = st.selectbox("To stack", names, index=names.index(drill.dst), key="tr_dst")
+    if drill.src == drill.dst:
+        st.info("Pick two different stacks.")
+        return
+
+    col3, col4 = st.columns(2)
+    with col3:
+        start = st.number_input("Start position", 1, 52, 1, key="tr_start")
+    with col4:
+        end = st.number_input("End position", 1, 52, 52, key="tr_end")
+    if start > end:
+        st.error("Start position must be ≤ end position.")
+        return
+
+    if st.button("🎲 New question", key="tr_new"):
+        drill.new_question(start, end)
+        ss["tr_answer_input"] = ""
+
+    st.divider()
+    if drill.question is None:
+        return
+
+    position = drill.question
+    card = get_stack(drill.src).card_at(position)
+    st.markdown(f"### {drill.src} position `{position}` → {drill.dst}?")
+    with st.expander("Reveal"):
+        st.markdown(render_card(card), unsafe_allow_html=True)
+        st.markdown(f"**{drill.dst} position:** `{drill.answer()}`")
+
+    answer = st.text_input(f"Position in {drill.dst}", key="tr_answer_input")
+    if st.button("Check answer", key="tr_check"):
+        if drill.check(answer):
+            st.success("✅ Correct!")
+        else:
+            st.error(f"❌ Incorrect. It is at {drill.dst} position `{drill.answer()}`.")
+
+    st.markdown("---")
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        st.metric("Attempts", drill.attempts)
+    with col_s2:
+        accuracy = drill.accuracy()
+        if accuracy is not None:
+            st.metric("Accuracy", f"{drill.correct}/{drill.attempts}", f"{accuracy * 100:.0f}%")
+        else:
+            st.metric("Accuracy", "–", "+0%")